@@ -7,6 +7,7 @@ provides a unified interface for accessing configuration values throughout the a
 
 import logging
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -27,18 +28,24 @@ class Config:
             "OPENFOODFACTS_API_BASE_URL": get_env(
                 "OPENFOODFACTS_API_BASE_URL", "https://world.openfoodfacts.org/api/v2"
             ),
-            "RATE_LIMIT_DELAY": float(get_env("RATE_LIMIT_DELAY", "0.5"))
+            "RATE_LIMIT_DELAY": float(get_env("RATE_LIMIT_DELAY", "0.5")),
+            # Documented request budgets used by the collection rate limiters
+            "USDA_REQUESTS_PER_HOUR": int(get_env("USDA_REQUESTS_PER_HOUR", "1000")),
+            "OPENFOODFACTS_REQUESTS_PER_MINUTE": int(get_env("OPENFOODFACTS_REQUESTS_PER_MINUTE", "10"))
         }
         
         self.ai_settings = {
             "model": get_env("AI_MODEL", "gpt-4o-mini"),
             "temperature": float(get_env("AI_TEMPERATURE", "0.2")),
-            "max_tokens": int(get_env("AI_MAX_TOKENS", "2000"))
+            "max_tokens": int(get_env("AI_MAX_TOKENS", "2000")),
+            "requests_per_minute": int(get_env("OPENAI_REQUESTS_PER_MINUTE", "500")),
+            "tokens_per_minute": int(get_env("OPENAI_TOKENS_PER_MINUTE", "200000"))
         }
         
         self.processing = {
             "batch_size": int(get_env("BATCH_SIZE", "10")),
-            "force_reprocess": self._parse_bool(get_env("FORCE_REPROCESS", "False"))
+            "force_reprocess": self._parse_bool(get_env("FORCE_REPROCESS", "False")),
+            "cache_dir": get_env("STEP_CACHE_DIR", "cache")
         }
         
         self.literature_sources = self.config_data.get("literature_sources", [])
@@ -110,6 +117,7 @@ class Config:
             "literature_sources": self.literature_sources,
         }
 
+@lru_cache(maxsize=4)
 def get_config(config_file: Optional[str] = None) -> Config:
     if config_file:
         return Config(config_file)
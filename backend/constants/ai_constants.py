@@ -27,7 +27,9 @@ TEMPERATURE_SETTINGS = {
 TEMPLATE_DIR = "scripts/ai/prompt_templates"
 
 # Rate limiting constants
-DEFAULT_RATE_LIMIT_DELAY = 0.5  # 500ms minimum between requests
+DEFAULT_REQUESTS_PER_MINUTE = 500
+DEFAULT_TOKENS_PER_MINUTE = 200000
+CHARS_PER_TOKEN = 4  # Rough prompt size estimate used for the token budget
 
 # Retry settings
 MAX_RETRIES = 3
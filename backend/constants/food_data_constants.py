@@ -167,7 +167,7 @@ DEFAULT_CONFIDENCE_RATINGS = {
 
 # API configuration constants
 OFF_DEFAULT_FIELDS = (
-    "code,product_name,product_name_en,categories_tags,image_url,"
+    "code,product_name,product_name_en,generic_name,categories_tags,image_url,"
     "nutriments,completeness,brands,"
     "ingredients_text,ingredients_tags,"
     "nova_group,nutrition_grades,ecoscore_grade,"
@@ -60,6 +60,55 @@ SET validated = %s, validation_errors = %s, updated_at = NOW()
 WHERE food_id = %s
 """
 
+# Track the food_data each row was last validated against, so unchanged rows
+# can be skipped on later runs
+FOOD_ADD_VALIDATED_HASH = """
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS validated_hash TEXT
+"""
+
+# Lock the next keyset page of foods that need known-answer validation
+FOOD_GET_VALIDATION_BATCH = """
+SELECT food_id, name, food_data
+FROM foods
+WHERE (validated = FALSE OR validated_hash IS DISTINCT FROM md5(food_data::text) OR %s)
+  AND food_id > %s
+ORDER BY food_id
+LIMIT %s
+FOR UPDATE SKIP LOCKED
+"""
+
+# Lock specific foods for known-answer validation
+FOOD_GET_VALIDATION_BY_IDS = """
+SELECT food_id, name, food_data
+FROM foods
+WHERE food_id = ANY(%s)
+ORDER BY food_id
+FOR UPDATE SKIP LOCKED
+"""
+
+# Record validation results for a batch (used with execute_values)
+FOOD_UPDATE_VALIDATION_BATCH = """
+UPDATE foods AS f
+SET validated = TRUE, validation_errors = v.errors,
+    validated_hash = md5(f.food_data::text), updated_at = NOW()
+FROM (VALUES %s) AS v(food_id, errors)
+WHERE f.food_id = v.food_id
+"""
+
+# Track the food_data each food was last calibrated into
+FOOD_ADD_CALIBRATED_HASH = """
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS calibrated_hash TEXT
+"""
+
+# Foods whose confidence scores changed since they were last calibrated
+FOOD_GET_CALIBRATION_PENDING = """
+SELECT food_id, name, food_data
+FROM foods
+WHERE food_data->'data_quality'->>'overall_confidence' IS NOT NULL
+  AND (calibrated_hash IS DISTINCT FROM md5(food_data::text) OR %s)
+ORDER BY food_id
+"""
+
 # Get all distinct food names
 FOOD_GET_DISTINCT_NAMES = """
 SELECT DISTINCT name FROM foods
@@ -539,4 +588,57 @@ FROM evaluation_metrics
 WHERE metrics_type = %s 
 ORDER BY timestamp DESC 
 LIMIT 1
-"""
\ No newline at end of file
+"""
+
+# Remember which search queries each collector has already imported, so reruns
+# can skip the search round trip
+COLLECTED_QUERIES_CREATE = """
+CREATE TABLE IF NOT EXISTS collected_queries (
+    source TEXT NOT NULL,
+    query_hash TEXT NOT NULL,
+    result_ids JSONB NOT NULL,
+    collected_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (source, query_hash)
+)
+"""
+
+# Get the stored results for a batch of query hashes
+COLLECTED_QUERIES_GET = """
+SELECT query_hash, result_ids
+FROM collected_queries
+WHERE source = %s AND query_hash = ANY(%s)
+"""
+
+# Record the results of a collected query
+COLLECTED_QUERY_UPSERT = """
+INSERT INTO collected_queries (source, query_hash, result_ids)
+VALUES (%s, %s, %s)
+ON CONFLICT (source, query_hash)
+DO UPDATE SET result_ids = EXCLUDED.result_ids, collected_at = NOW()
+"""
+
+# Which of a batch of food IDs are already stored
+FOOD_GET_EXISTING_IDS = """
+SELECT food_id FROM foods WHERE food_id = ANY(%s)
+"""
+
+# Migration checks: each returns a single "applied" boolean from the catalog, so
+# an up-to-date database is verified without taking any DDL locks
+TABLE_EXISTS = """
+SELECT to_regclass(%s) IS NOT NULL AS applied
+"""
+
+COLUMN_EXISTS = """
+SELECT EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_name = %s AND column_name = %s
+) AS applied
+"""
+
+# Schema additions the pipeline depends on, as (name, check, check params, DDL),
+# applied in order by PostgresClient.migrate_pipeline_schema
+PIPELINE_MIGRATIONS = (
+    ("collected_queries table", TABLE_EXISTS, ("collected_queries",), COLLECTED_QUERIES_CREATE),
+    ("foods.validated_hash column", COLUMN_EXISTS, ("foods", "validated_hash"), FOOD_ADD_VALIDATED_HASH),
+    ("foods.calibrated_hash column", COLUMN_EXISTS, ("foods", "calibrated_hash"), FOOD_ADD_CALIBRATED_HASH),
+)
@@ -1,7 +1,9 @@
 from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 
+import orjson
+
 from constants.food_data_enums import (
     ImpactType, Direction, TimeToEffect, BrainNutrientSource, 
     ImpactsSource, SourcePriorityType, InteractionType, 
@@ -11,13 +13,24 @@ from constants.food_data_constants import (
     DEFAULT_CONFIDENCE_RATINGS, FOOD_CATEGORY_MAPPING
 )
 
-@dataclass
+# Field names per dataclass for _to_dict and field_items; filled in for every
+# FoodData component at the bottom of this module, others on first use
+_FIELD_NAMES: Dict[type, tuple] = {}
+
+def field_items(obj: Any) -> Dict[str, Any]:
+    """Shallow field name -> value mapping of a dataclass instance (slotted ones have no vars())."""
+    names = _FIELD_NAMES.get(type(obj))
+    if names is None:
+        names = _FIELD_NAMES[type(obj)] = tuple(f.name for f in fields(obj))
+    return {name: getattr(obj, name) for name in names}
+
+@dataclass(slots=True)
 class ServingInfo:
     serving_size: float = 100.0
     serving_unit: str = "g"
     household_serving: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class StandardNutrients:
     calories: Optional[float] = None
     protein_g: Optional[float] = None
@@ -39,7 +52,7 @@ class StandardNutrients:
     vitamin_c_mg: Optional[float] = None
     vitamin_a_iu: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True)
 class Omega3:
     total_g: Optional[float] = None
     epa_mg: Optional[float] = None
@@ -47,7 +60,7 @@ class Omega3:
     ala_mg: Optional[float] = None
     confidence: Optional[int] = DEFAULT_CONFIDENCE_RATINGS.get("omega3", 5)
 
-@dataclass
+@dataclass(slots=True)
 class BrainNutrients:
     tryptophan_mg: Optional[float] = None
     tyrosine_mg: Optional[float] = None
@@ -62,7 +75,7 @@ class BrainNutrients:
     choline_mg: Optional[float] = None
     omega3: Optional[Omega3] = None
 
-@dataclass
+@dataclass(slots=True)
 class BioactiveCompounds:
     polyphenols_mg: Optional[float] = None
     flavonoids_mg: Optional[float] = None
@@ -71,7 +84,7 @@ class BioactiveCompounds:
     probiotics_cfu: Optional[float] = None
     prebiotic_fiber_g: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True)
 class ResearchSupport:
     citation: str
     doi: Optional[str] = None
@@ -79,7 +92,7 @@ class ResearchSupport:
     study_type: Optional[str] = None
     year: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class MentalHealthImpact:
     impact_type: Union[ImpactType, str]
     direction: Union[Direction, str]
@@ -111,7 +124,7 @@ class MentalHealthImpact:
             except ValueError:
                 pass
 
-@dataclass
+@dataclass(slots=True)
 class NutrientInteraction:
     interaction_id: str
     nutrients_involved: List[str]
@@ -131,7 +144,7 @@ class NutrientInteraction:
             except ValueError:
                 pass
 
-@dataclass
+@dataclass(slots=True)
 class CircadianFactor:
     factor: str
     effects: List[str]
@@ -139,32 +152,32 @@ class CircadianFactor:
     confidence: int
     citations: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class CircadianEffects:
     description: Optional[str] = None
     factors: List[CircadianFactor] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class FoodCombination:
     combination: str
     effects: List[str]
     relevant_to: List[str]
     confidence: int
 
-@dataclass
+@dataclass(slots=True)
 class PreparationEffect:
     method: str
     effects: List[str]
     relevant_to: List[str]
     confidence: int
 
-@dataclass
+@dataclass(slots=True)
 class ContextualFactors:
     circadian_effects: Optional[CircadianEffects] = None
     food_combinations: List[FoodCombination] = field(default_factory=list)
     preparation_effects: List[PreparationEffect] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class NutrientVariation:
     nutrient: str
     effect: str
@@ -174,13 +187,13 @@ class NutrientVariation:
     recommendations: List[str] = field(default_factory=list)
     citations: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class PopulationVariation:
     population: str
     description: str
     variations: List[NutrientVariation] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class DietaryPattern:
     pattern_name: Union[PatternName, str]
     pattern_contribution: Union[PatternContribution, str]
@@ -200,7 +213,7 @@ class DietaryPattern:
             except ValueError:
                 pass
 
-@dataclass
+@dataclass(slots=True)
 class InflammatoryIndex:
     value: float
     confidence: int = DEFAULT_CONFIDENCE_RATINGS.get("inflammatory_index", 5)
@@ -215,7 +228,7 @@ class InflammatoryIndex:
             except ValueError:
                 pass
 
-@dataclass
+@dataclass(slots=True)
 class NeuralTarget:
     pathway: str
     effect: Union[EffectType, str]
@@ -231,7 +244,7 @@ class NeuralTarget:
             except ValueError:
                 pass
 
-@dataclass
+@dataclass(slots=True)
 class SourcePriority:
     standard_nutrients: Optional[SourcePriorityType] = None
     brain_nutrients: Optional[SourcePriorityType] = None
@@ -257,7 +270,7 @@ class SourcePriority:
             except ValueError:
                 pass
 
-@dataclass
+@dataclass(slots=True)
 class DataQuality:
     completeness: float
     overall_confidence: int
@@ -283,7 +296,7 @@ class DataQuality:
         if isinstance(self.source_priority, dict):
             self.source_priority = SourcePriority(**self.source_priority)
 
-@dataclass
+@dataclass(slots=True)
 class Metadata:
     version: str
     created: str
@@ -293,7 +306,51 @@ class Metadata:
     image_url: Optional[str] = None
     tags: List[str] = field(default_factory=list)
 
-@dataclass
+# Nested dataclass layout used by FoodData.from_dict, built once at import
+_NESTED_STRUCTURE = {
+    'standard_nutrients': (StandardNutrients, {}),
+    'serving_info': (ServingInfo, {}),
+    'brain_nutrients': (BrainNutrients, {'omega3': Omega3}),
+    'bioactive_compounds': (BioactiveCompounds, {}),
+    'data_quality': (DataQuality, {'source_priority': SourcePriority}),
+    'metadata': (Metadata, {}),
+    'inflammatory_index': (InflammatoryIndex, {}),
+    'contextual_factors': (ContextualFactors, {
+        'circadian_effects': CircadianEffects
+    })
+}
+
+_LIST_FIELDS = {
+    'mental_health_impacts': (MentalHealthImpact, {'research_support': ResearchSupport}),
+    'nutrient_interactions': (NutrientInteraction, {'research_support': ResearchSupport}),
+    'population_variations': (PopulationVariation, {'variations': NutrientVariation}),
+    'dietary_patterns': (DietaryPattern, {}),
+    'neural_targets': (NeuralTarget, {})
+}
+
+def _to_dict(obj: Any) -> Any:
+    """
+    Recursively convert dataclasses to dicts, like dataclasses.asdict.
+    
+    Containers are rebuilt so the result shares no mutable state with obj, but
+    leaf values are returned as-is rather than deep-copied, since they are all
+    immutable here (str, numbers, enums).
+    """
+    obj_type = type(obj)
+    if obj_type is list:
+        return [_to_dict(item) for item in obj]
+    if obj_type is dict:
+        return {_to_dict(key): _to_dict(value) for key, value in obj.items()}
+    if obj_type is tuple:
+        return tuple(_to_dict(item) for item in obj)
+    if hasattr(obj_type, '__dataclass_fields__'):
+        names = _FIELD_NAMES.get(obj_type)
+        if names is None:
+            names = _FIELD_NAMES[obj_type] = tuple(f.name for f in fields(obj_type))
+        return {name: _to_dict(getattr(obj, name)) for name in names}
+    return obj
+
+@dataclass(slots=True)
 class FoodData:
     food_id: str
     name: str
@@ -318,7 +375,11 @@ class FoodData:
     
     def to_dict(self) -> Dict:
         """Convert dataclass to dictionary."""
-        return asdict(self)
+        return _to_dict(self)
+    
+    def to_json(self) -> str:
+        """Serialize to a JSON string."""
+        return orjson.dumps(self).decode()
     
     def update_timestamp(self) -> None:
         self.metadata.last_updated = datetime.now().isoformat()
@@ -353,13 +414,12 @@ class FoodData:
         # Handle nested fields if specified
         if nested_fields:
             data_copy = data.copy()
-            for field_name, field_type in nested_fields.items():
-                if field_name in data_copy:
-                    if isinstance(data_copy[field_name], dict):
-                        data_copy[field_name] = cls._create_nested_dataclass(
-                            data_copy[field_name], 
-                            field_type
-                        )
+            for field_name in data_copy.keys() & nested_fields.keys():
+                if isinstance(data_copy[field_name], dict):
+                    data_copy[field_name] = cls._create_nested_dataclass(
+                        data_copy[field_name], 
+                        nested_fields[field_name]
+                    )
             return dataclass_type(**data_copy)
             
         return dataclass_type(**data)
@@ -383,47 +443,27 @@ class FoodData:
     @classmethod
     def from_dict(cls, data: Dict) -> 'FoodData':
         """Create FoodData instance from dictionary."""
-        nested_structure = {
-            'standard_nutrients': (StandardNutrients, {}),
-            'serving_info': (ServingInfo, {}),
-            'brain_nutrients': (BrainNutrients, {'omega3': Omega3}),
-            'bioactive_compounds': (BioactiveCompounds, {}),
-            'data_quality': (DataQuality, {'source_priority': SourcePriority}),
-            'metadata': (Metadata, {}),
-            'inflammatory_index': (InflammatoryIndex, {}),
-            'contextual_factors': (ContextualFactors, {
-                'circadian_effects': CircadianEffects
-            })
-        }
-        
         # Create a copy of the data to avoid modifying the original
         data_copy = data.copy()
         
-        # Handle nested dataclasses
-        for field_name, (dataclass_type, nested_fields) in nested_structure.items():
-            if field_name in data_copy:
-                data_copy[field_name] = cls._create_nested_dataclass(
-                    data_copy[field_name],
-                    dataclass_type,
-                    nested_fields
-                )
+        # Handle nested dataclasses; one key-set intersection picks out the
+        # nested fields actually present instead of probing each one
+        for field_name in data_copy.keys() & _NESTED_STRUCTURE.keys():
+            dataclass_type, nested_fields = _NESTED_STRUCTURE[field_name]
+            data_copy[field_name] = cls._create_nested_dataclass(
+                data_copy[field_name],
+                dataclass_type,
+                nested_fields
+            )
         
         # Handle lists of dataclasses
-        list_fields = {
-            'mental_health_impacts': (MentalHealthImpact, {'research_support': ResearchSupport}),
-            'nutrient_interactions': (NutrientInteraction, {'research_support': ResearchSupport}),
-            'population_variations': (PopulationVariation, {'variations': NutrientVariation}),
-            'dietary_patterns': (DietaryPattern, {}),
-            'neural_targets': (NeuralTarget, {})
-        }
-        
-        for field_name, (dataclass_type, nested_fields) in list_fields.items():
-            if field_name in data_copy:
-                data_copy[field_name] = cls._create_list_of_dataclasses(
-                    data_copy[field_name],
-                    dataclass_type,
-                    nested_fields
-                )
+        for field_name in data_copy.keys() & _LIST_FIELDS.keys():
+            dataclass_type, nested_fields = _LIST_FIELDS[field_name]
+            data_copy[field_name] = cls._create_list_of_dataclasses(
+                data_copy[field_name],
+                dataclass_type,
+                nested_fields
+            )
         
         if 'metadata' not in data_copy:
             data_copy['metadata'] = Metadata(
@@ -434,6 +474,11 @@ class FoodData:
         
         # Create the FoodData instance
         return cls(**data_copy)
+    
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> 'FoodData':
+        """Create FoodData instance from a JSON string."""
+        return cls.from_dict(orjson.loads(raw))
 
 @dataclass
 class EvaluationMetrics:
@@ -496,4 +541,17 @@ class FoodEvaluation:
             timestamp=data.get("timestamp", datetime.now().isoformat()),
             evaluation_type=data.get("evaluation_type", ""),
             evaluation_data=data.get("evaluation_data", {})
-        )
\ No newline at end of file
+        )
+
+# Resolve field names for every FoodData component up front, so serializing
+# the first food doesn't pay for it
+_FIELD_NAMES.update({
+    dataclass_type: tuple(f.name for f in fields(dataclass_type))
+    for dataclass_type in (
+        FoodData, ServingInfo, StandardNutrients, Omega3, BrainNutrients,
+        BioactiveCompounds, ResearchSupport, MentalHealthImpact, NutrientInteraction,
+        CircadianFactor, CircadianEffects, FoodCombination, PreparationEffect,
+        ContextualFactors, NutrientVariation, PopulationVariation, DietaryPattern,
+        InflammatoryIndex, NeuralTarget, SourcePriority, DataQuality, Metadata
+    )
+})
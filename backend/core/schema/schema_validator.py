@@ -1,4 +1,5 @@
-from typing import Dict, List, Any, Union
+from itertools import islice
+from typing import Dict, Iterator, List, Any, Optional, Union
 from dataclasses import is_dataclass, fields
 
 from schema.food_data import (
@@ -14,8 +15,14 @@ from constants.food_data_enums import ImpactType, Direction, TimeToEffect
 class SchemaValidator:
     """Validates food data against the schema."""
     
+    # Fixed validation rules, built once rather than on every call
+    _REQUIRED_FIELDS = ("food_id", "name", "category", "standard_nutrients", "data_quality", "metadata")
+    _IMPACT_REQUIRED_FIELDS = ("impact_type", "direction", "mechanism", "strength", "confidence")
+    _METADATA_REQUIRED_FIELDS = ("version", "created", "last_updated")
+    _NUMERIC_TYPES = (int, float, type(None))
+    
     @staticmethod
-    def validate_food_data(data: Union[Dict, FoodData]) -> List[str]:
+    def validate_food_data(data: Union[Dict, FoodData], max_warnings: Optional[int] = None) -> List[str]:
         errors = []
         
         # Convert FoodData instance to dict if needed
@@ -23,8 +30,7 @@ class SchemaValidator:
             data = data.to_dict()
         
         # Required fields
-        required_fields = ["food_id", "name", "category", "standard_nutrients", "data_quality", "metadata"]
-        for field in required_fields:
+        for field in SchemaValidator._REQUIRED_FIELDS:
             if field not in data:
                 errors.append(f"Missing required field: {field}")
         
@@ -54,7 +60,7 @@ class SchemaValidator:
             errors.extend(SchemaValidator._validate_data_quality(data["data_quality"]))
         
         # Add data quality checks
-        quality_warnings = SchemaValidator.check_data_quality(data)
+        quality_warnings = SchemaValidator.check_data_quality(data, max_warnings)
         errors.extend(quality_warnings)
         
         return errors
@@ -66,7 +72,7 @@ class SchemaValidator:
         
         # Check for required fields
         for field in STD_NUTRIENT_FIELDS:
-            if field in nutrients and not isinstance(nutrients[field], (int, float, type(None))):
+            if field in nutrients and not isinstance(nutrients[field], SchemaValidator._NUMERIC_TYPES):
                 errors.append(f"standard_nutrients.{field} must be a number or null")
         
         return errors
@@ -78,7 +84,7 @@ class SchemaValidator:
         
         # Check for required fields
         for field in BRAIN_NUTRIENTS_FIELDS:
-            if field in nutrients and not isinstance(nutrients[field], (int, float, type(None))):
+            if field in nutrients and not isinstance(nutrients[field], SchemaValidator._NUMERIC_TYPES):
                 errors.append(f"brain_nutrients.{field} must be a number or null")
         
         # Validate omega-3 if present
@@ -88,7 +94,7 @@ class SchemaValidator:
                 errors.append("brain_nutrients.omega3 must be a dictionary")
             else:
                 for field in OMEGA3_FIELDS:
-                    if field in omega3 and not isinstance(omega3[field], (int, float, type(None))):
+                    if field in omega3 and not isinstance(omega3[field], SchemaValidator._NUMERIC_TYPES):
                         errors.append(f"brain_nutrients.omega3.{field} must be a number or null")
         
         return errors
@@ -100,8 +106,7 @@ class SchemaValidator:
         
         for i, impact in enumerate(impacts):
             # Check required fields
-            required_fields = ["impact_type", "direction", "mechanism", "strength", "confidence"]
-            for field in required_fields:
+            for field in SchemaValidator._IMPACT_REQUIRED_FIELDS:
                 if field not in impact:
                     errors.append(f"mental_health_impacts[{i}].{field} is required")
             
@@ -129,8 +134,7 @@ class SchemaValidator:
         """Validate metadata section."""
         errors = []
         
-        required_fields = ["version", "created", "last_updated"]
-        for field in required_fields:
+        for field in SchemaValidator._METADATA_REQUIRED_FIELDS:
             if field not in metadata:
                 errors.append(f"metadata.{field} is required")
         
@@ -169,10 +173,19 @@ class SchemaValidator:
         return errors
     
     @staticmethod
-    def check_data_quality(food_data: Dict) -> List[str]:
-        """Check for data quality issues beyond basic schema validation."""
-        warnings = []
-        
+    def check_data_quality(food_data: Dict, max_warnings: Optional[int] = None) -> List[str]:
+        """
+        Check for data quality issues beyond basic schema validation.
+        
+        Args:
+            food_data: Food data dictionary
+            max_warnings: Stop checking once this many warnings are found (None for no limit)
+        """
+        return list(islice(SchemaValidator._iter_quality_warnings(food_data), max_warnings))
+    
+    @staticmethod
+    def _iter_quality_warnings(food_data: Dict) -> Iterator[str]:
+        """Yield data quality warnings lazily so callers can stop early."""
         # Check for missing brain nutrients
         if 'brain_nutrients' in food_data:
             brain_nutrients = food_data['brain_nutrients']
@@ -180,13 +193,13 @@ class SchemaValidator:
             # Check core brain nutrients
             missing = [n for n in BRAIN_NUTRIENTS_FIELDS if n not in brain_nutrients or brain_nutrients.get(n) is None]
             if missing:
-                warnings.append(f"Missing core brain nutrients: {', '.join(missing)}")
+                yield f"Missing core brain nutrients: {', '.join(missing)}"
             
             # Check omega-3 completeness
             if 'omega3' in brain_nutrients:
                 omega3 = brain_nutrients['omega3']
                 if 'total_g' not in omega3 or omega3['total_g'] is None:
-                    warnings.append("Missing total omega-3 value")
+                    yield "Missing total omega-3 value"
                 
                 # Check for implausible omega-3 values
                 if 'total_g' in omega3 and omega3['total_g'] is not None:
@@ -201,7 +214,7 @@ class SchemaValidator:
                     if components_sum > 0:
                         components_g = components_sum / 1000  # Convert mg to g
                         if components_g > total_g * 1.1:  # Allow 10% margin for rounding
-                            warnings.append(f"Omega-3 components ({components_g:.2f}g) exceed total ({total_g:.2f}g)")
+                            yield f"Omega-3 components ({components_g:.2f}g) exceed total ({total_g:.2f}g)"
         
         # Check mental health impacts
         if 'mental_health_impacts' in food_data and food_data['mental_health_impacts']:
@@ -210,7 +223,7 @@ class SchemaValidator:
             for i, impact in enumerate(impacts):
                 # Check for impacts without research support
                 if 'research_support' not in impact or not impact['research_support']:
-                    warnings.append(f"Impact #{i+1} ({impact.get('impact_type', 'unknown')}) has no research support")
+                    yield f"Impact #{i+1} ({impact.get('impact_type', 'unknown')}) has no research support"
                 
                 # Check for high strength with low confidence
                 if 'strength' in impact and 'confidence' in impact:
@@ -218,7 +231,7 @@ class SchemaValidator:
                     confidence = impact['confidence']
                     
                     if strength > 7 and confidence < 5:
-                        warnings.append(f"Impact #{i+1} has high strength ({strength}) but low confidence ({confidence})")
+                        yield f"Impact #{i+1} has high strength ({strength}) but low confidence ({confidence})"
         
         # Check for inconsistencies in values
         if 'standard_nutrients' in food_data and 'protein_g' in food_data['standard_nutrients']:
@@ -233,6 +246,4 @@ class SchemaValidator:
                     tryptophan_percent = (tryptophan / protein) / 10  # Convert mg/g to percentage
                     
                     if tryptophan_percent < 0.5 or tryptophan_percent > 2.0:
-                        warnings.append(f"Unusual tryptophan proportion ({tryptophan_percent:.2f}% of protein)")
-        
-        return warnings
\ No newline at end of file
+                        yield f"Unusual tryptophan proportion ({tryptophan_percent:.2f}% of protein)"
\ No newline at end of file
@@ -13,17 +13,25 @@ the established data models for better type safety and validation.
 """
 
 import os
-import json
+import csv
+import io
 import glob
 import argparse
+import contextvars
+import queue
+import threading
 from datetime import datetime
 import sys
-from typing import Dict, List, Optional, Tuple
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Import project utilities
 from utils.logging_utils import setup_logging
+import orjson
+
 from utils.db_utils import PostgresClient
 from config import get_config
+from constants.sql_queries import FOOD_GET_CALIBRATION_PENDING
 
 # Import data models
 from schema.food_data import (
@@ -34,6 +42,9 @@ from schema.food_data import (
 # Initialize logger
 logger = setup_logging(__name__)
 
+# Seconds the prefetch thread waits on a full queue before re-checking for a stop
+PREFETCH_PUT_TIMEOUT = 0.5
+
 class ConfidenceCalibrationSystem:
     """System for calibrating confidence ratings in the nutritional psychiatry database."""
     
@@ -41,11 +52,16 @@ class ConfidenceCalibrationSystem:
         self,
         db_client: Optional[PostgresClient] = None,
         batch_size: int = 100,
-        dry_run: bool = False
+        dry_run: bool = False,
+        force_reprocess: bool = False
     ):
         self.db_client = db_client or PostgresClient()
         self.batch_size = batch_size
         self.dry_run = dry_run
+        self.force_reprocess = force_reprocess
+        
+        # calibrated_hash is added by the pipeline's one-time schema migration
+        self.db_client.migrate_pipeline_schema()
         
         # Load evaluation metrics to guide calibration
         self.calibration_model = self._load_calibration_model()
@@ -310,70 +326,86 @@ class ConfidenceCalibrationSystem:
                 # Update confidence
                 impact.confidence = new_confidence
     
-    def get_foods_to_calibrate(self, batch_size: int = None, offset: int = 0) -> List[Dict]:
+    def get_foods_to_calibrate(self, batch_size: int = None) -> Iterator[List[Dict]]:
         """
-        Get foods that need confidence calibration from the database.
+        Stream foods that need confidence calibration from the database.
+        
+        Rows come from a single server-side cursor instead of repeated
+        LIMIT/OFFSET queries, so each row is read once and memory stays flat.
+        Foods unchanged since their last calibration are skipped unless
+        force_reprocess is set.
         
         Args:
-            batch_size: Maximum number of foods to retrieve
-            offset: Offset for pagination
+            batch_size: Number of foods per yielded batch
             
-        Returns:
-            List of food data dictionaries
+        Yields:
+            Lists of food data dictionaries
         """
         limit = batch_size or self.batch_size
         
         try:
-            query = """
-            SELECT food_id, name, food_data
-            FROM foods
-            WHERE food_data->'data_quality'->>'overall_confidence' IS NOT NULL
-            ORDER BY food_id
-            LIMIT %s OFFSET %s
-            """
-            
-            results = self.db_client.execute_query(query, (limit, offset))
-            return results
-            
+            rows = self.db_client.stream_query(
+                FOOD_GET_CALIBRATION_PENDING, (self.force_reprocess,), itersize=limit, name="calibration_stream"
+            )
+            while True:
+                batch = list(islice(rows, limit))
+                if not batch:
+                    return
+                yield batch
+                
         except Exception as e:
             logger.error(f"Error fetching foods to calibrate: {e}")
-            return []
     
-    def save_calibrated_food(self, food_id: str, calibrated_data: Dict) -> bool:
+    def save_calibrated_batch(self, updates: List[Tuple[str, Dict]]) -> List[str]:
         """
-        Save calibrated food data to the database.
+        Save a batch of calibrated foods via COPY into a staging table and a single UPDATE.
         
         Args:
-            food_id: Food ID
-            calibrated_data: Calibrated food data
+            updates: List of (food_id, calibrated_data) tuples
             
         Returns:
-            True if saved successfully, False otherwise
+            List of food IDs that were updated
         """
+        if not updates:
+            return []
+        
         if self.dry_run:
-            logger.info(f"DRY RUN: Would save calibrated data for {food_id}")
-            return True
-            
+            logger.info(f"DRY RUN: Would save calibrated data for {len(updates)} foods")
+            return [food_id for food_id, _ in updates]
+        
         try:
+            # Stream the batch into a transaction-scoped staging table with COPY,
+            # then apply it to foods with one UPDATE ... FROM join
+            payload = io.StringIO()
+            writer = csv.writer(payload)
+            for food_id, data in updates:
+                writer.writerow((food_id, orjson.dumps(data).decode()))
+            payload.seek(0)
+            
             query = """
-            UPDATE foods
-            SET food_data = %s, 
+            UPDATE foods AS f
+            SET food_data = s.food_data,
+                calibrated_hash = md5(s.food_data::text),
                 last_updated = NOW()
-            WHERE food_id = %s
-            RETURNING food_id
+            FROM staging_foods s
+            WHERE f.food_id = s.food_id
+            RETURNING f.food_id
             """
             
-            result = self.db_client.execute_query(query, (json.dumps(calibrated_data), food_id))
+            with self.db_client.get_cursor() as cursor:
+                # Calibrated scores can be recomputed, so don't wait on the WAL flush
+                cursor.execute("SET LOCAL synchronous_commit = OFF")
+                cursor.execute(
+                    "CREATE TEMP TABLE staging_foods (food_id TEXT PRIMARY KEY, food_data JSONB) ON COMMIT DROP"
+                )
+                cursor.copy_expert("COPY staging_foods (food_id, food_data) FROM STDIN WITH (FORMAT csv)", payload)
+                cursor.execute(query)
+                results = cursor.fetchall()
+            return [row['food_id'] for row in results]
             
-            if result and result[0]['food_id'] == food_id:
-                return True
-            else:
-                logger.warning(f"Food {food_id} not found in database")
-                return False
-                
         except Exception as e:
-            logger.error(f"Error saving calibrated food {food_id}: {e}")
-            return False
+            logger.error(f"Error saving calibrated batch of {len(updates)} foods: {e}")
+            return []
     
     def calibrate_batch(self, batch: List[Dict]) -> Tuple[int, int]:
         """
@@ -385,27 +417,51 @@ class ConfidenceCalibrationSystem:
         Returns:
             Tuple of (successful_count, failed_count)
         """
-        success_count = 0
         failure_count = 0
+        updates = []
         
         for item in batch:
             food_id = item['food_id']
             food_data = item['food_data']
             
             try:
-                calibrated = self.calibrate_confidence(food_data)
-                
-                if self.save_calibrated_food(food_id, calibrated):
-                    success_count += 1
-                else:
-                    failure_count += 1
-                    logger.warning(f"Failed to save calibrated food {food_id}")
-                    
+                updates.append((food_id, self.calibrate_confidence(food_data)))
             except Exception as e:
                 failure_count += 1
                 logger.error(f"Error processing food {food_id}: {e}")
         
-        return success_count, failure_count
+        saved_ids = set(self.save_calibrated_batch(updates))
+        for food_id, _ in updates:
+            if food_id not in saved_ids:
+                failure_count += 1
+                logger.warning(f"Failed to save calibrated food {food_id}")
+        
+        return len(saved_ids), failure_count
+    
+    def _prefetch_batches(self, batches: queue.Queue, stop: threading.Event) -> None:
+        """
+        Feed calibration batches into a queue, ending with None.
+        
+        Puts time out and re-check ``stop``, so the thread gives up (closing the
+        stream and returning its pooled connection) once the consumer has gone.
+        """
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=PREFETCH_PUT_TIMEOUT)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        food_batches = self.get_foods_to_calibrate(self.batch_size)
+        try:
+            for batch in food_batches:
+                if not put(batch):
+                    break
+        finally:
+            food_batches.close()
+            put(None)
     
     def calibrate_database(self) -> Dict[str, int]:
         """
@@ -423,25 +479,31 @@ class ConfidenceCalibrationSystem:
             "batches": 0
         }
         
-        offset = 0
-        while True:
-            batch = self.get_foods_to_calibrate(self.batch_size, offset)
-            
-            if not batch:
-                break
-            
-            stats["batches"] += 1
-            stats["total_processed"] += len(batch)
-            
-            success, failure = self.calibrate_batch(batch)
-            
-            stats["successfully_calibrated"] += success
-            stats["failed"] += failure
-            
-            offset += len(batch)
-            
-            if len(batch) < self.batch_size:
-                break
+        # Fetch the next batch on a background thread while this one is calibrated
+        batches = queue.Queue(maxsize=1)
+        stop = threading.Event()
+        prefetcher = threading.Thread(
+            target=contextvars.copy_context().run, args=(self._prefetch_batches, batches, stop), daemon=True
+        )
+        prefetcher.start()
+        
+        try:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                
+                stats["batches"] += 1
+                stats["total_processed"] += len(batch)
+                
+                success, failure = self.calibrate_batch(batch)
+                
+                stats["successfully_calibrated"] += success
+                stats["failed"] += failure
+        finally:
+            # Release the prefetcher even when calibration stops early
+            stop.set()
+            prefetcher.join()
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -17,7 +17,7 @@ import sys
 
 # Import project models
 from schema.food_data import (
-    FoodData, Omega3, EvaluationMetrics, FoodEvaluation
+    FoodData, Omega3, EvaluationMetrics, FoodEvaluation, field_items
 )
 
 # Import project utilities
@@ -475,7 +475,7 @@ class KnownAnswerTester:
         # Convert model to dict for the OpenAI API
         standard_nutrients = {}
         if food.standard_nutrients:
-            standard_nutrients = {k: v for k, v in food.standard_nutrients.__dict__.items() 
+            standard_nutrients = {k: v for k, v in field_items(food.standard_nutrients).items() 
                                 if not k.startswith('_') and v is not None}
         
         # Get predictions from the AI
@@ -617,25 +617,25 @@ class KnownAnswerTester:
         # Convert models to dicts for the OpenAI API
         standard_nutrients = {}
         if food.standard_nutrients:
-            standard_nutrients = {k: v for k, v in food.standard_nutrients.__dict__.items() 
+            standard_nutrients = {k: v for k, v in field_items(food.standard_nutrients).items() 
                                 if not k.startswith('_') and v is not None}
         
         brain_nutrients = {}
         if food.brain_nutrients:
             # Handle nested Omega3 object
-            brain_nutrients = {k: v for k, v in food.brain_nutrients.__dict__.items() 
+            brain_nutrients = {k: v for k, v in field_items(food.brain_nutrients).items() 
                              if not k.startswith('_') and v is not None 
                              and not isinstance(v, Omega3)}
             
             # Add omega3 if present
             if food.brain_nutrients.omega3:
-                omega3_dict = {k: v for k, v in food.brain_nutrients.omega3.__dict__.items() 
+                omega3_dict = {k: v for k, v in field_items(food.brain_nutrients.omega3).items() 
                               if not k.startswith('_') and v is not None}
                 brain_nutrients['omega3'] = omega3_dict
         
         bioactive_compounds = {}
         if food.bioactive_compounds:
-            bioactive_compounds = {k: v for k, v in food.bioactive_compounds.__dict__.items() 
+            bioactive_compounds = {k: v for k, v in field_items(food.bioactive_compounds).items() 
                                  if not k.startswith('_') and v is not None}
         
         # Get predictions from the AI
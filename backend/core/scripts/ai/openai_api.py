@@ -11,9 +11,13 @@ This module handles all interactions with the OpenAI API for data enrichment:
 """
 
 import asyncio
+import hashlib
 import os
+import threading
 import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Union
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 import openai
 from openai import OpenAI
@@ -29,18 +33,47 @@ from utils.db_utils import PostgresClient
 
 # Import data models
 from schema.food_data import (
-    BrainNutrients, NutrientInteraction, Omega3, BioactiveCompounds, MentalHealthImpact, ResearchSupport, StandardNutrients
+    BrainNutrients, NutrientInteraction, Omega3, BioactiveCompounds, MentalHealthImpact, ResearchSupport, StandardNutrients,
+    field_items
 )
 
 # Constants
 from constants.ai_constants import (
     DEFAULT_AI_MODELS, TEMPERATURE_SETTINGS, MAX_RETRIES, 
-    BACKOFF_FACTOR, REQUEST_TIMEOUT, DEFAULT_RATE_LIMIT_DELAY
+    BACKOFF_FACTOR, REQUEST_TIMEOUT, DEFAULT_REQUESTS_PER_MINUTE,
+    DEFAULT_TOKENS_PER_MINUTE, CHARS_PER_TOKEN
 )
 
 # Initialize logger
 logger = setup_logging(__name__)
 
+# Completed responses kept per client, keyed by a hash of the exact request
+RESPONSE_CACHE_SIZE = 4096
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket shared by every event loop using a client.
+    
+    A reservation is taken immediately, possibly driving the balance negative;
+    the caller then waits until the bucket has refilled to cover it.
+    """
+    
+    def __init__(self, capacity: float, period: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def reserve(self, amount: float) -> float:
+        """Reserve amount tokens and return the seconds to wait before spending them."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= min(amount, self.capacity)
+            return max(0.0, -self.tokens / self.rate)
+
 class OpenAIAPI:
     """
     Client for interacting with OpenAI API for nutritional psychiatry data enrichment.
@@ -54,7 +87,8 @@ class OpenAIAPI:
         max_retries: int = MAX_RETRIES,
         backoff_factor: float = BACKOFF_FACTOR,
         request_timeout: int = REQUEST_TIMEOUT,
-        rate_limit_delay: float = DEFAULT_RATE_LIMIT_DELAY
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE
     ):
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         if not self.api_key:
@@ -65,11 +99,18 @@ class OpenAIAPI:
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.request_timeout = request_timeout
-        self.rate_limit_delay = rate_limit_delay
+        
+        # Stay under both OpenAI budgets up front instead of retrying 429s
+        self.request_budget = _TokenBucket(requests_per_minute, 60)
+        self.token_budget = _TokenBucket(tokens_per_minute, 60)
+        
+        # Identical prompts (e.g. the same food arriving from two sources) are
+        # answered once per run
+        self._response_cache: OrderedDict = OrderedDict()
+        self._response_cache_lock = threading.Lock()
         
         self.db_client = db_client        
         self.client = OpenAI(api_key=self.api_key, timeout=request_timeout)
-        self.last_request_time = 0
     
     def get_model_for_task(self, task_type: str) -> str:
         return self.models.get(task_type, self.models.get("fallback", "gpt-4o-mini"))
@@ -77,14 +118,12 @@ class OpenAIAPI:
     def get_temperature_for_task(self, task_type: str) -> float:
         return TEMPERATURE_SETTINGS.get(task_type, 0.3)
     
-    async def _apply_rate_limiting(self):
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+    async def _apply_rate_limiting(self, messages: List[Dict[str, str]]):
+        prompt_tokens = sum(len(message.get("content") or "") for message in messages) // CHARS_PER_TOKEN
+        delay = max(self.request_budget.reserve(1), self.token_budget.reserve(prompt_tokens))
         
-        if time_since_last_request < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last_request)
-        
-        self.last_request_time = time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
     
     @retry(
         retry=retry_if_exception_type((openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError)),
@@ -118,12 +157,20 @@ class OpenAIAPI:
         if temperature is None:
             temperature = self.get_temperature_for_task(task_type)
 
+        cache_key = hashlib.blake2b(
+            orjson.dumps([model, temperature, messages], option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).hexdigest()
+        with self._response_cache_lock:
+            if cache_key in self._response_cache:
+                self._response_cache.move_to_end(cache_key)
+                return self._response_cache[cache_key]
+        
         # Log request
         log_api_request(logger, "openai", task_type, model, messages, {"temperature": temperature})
     
         try:
             # Apply rate limiting
-            await self._apply_rate_limiting()
+            await self._apply_rate_limiting(messages)
 
             # Extract system message for instructions
             instructions = None
@@ -150,6 +197,10 @@ class OpenAIAPI:
             
             if response.status == "completed":
                 log_api_response(logger, "openai", task_type, response.output_text)
+                with self._response_cache_lock:
+                    self._response_cache[cache_key] = response.output_text
+                    if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
                 return response.output_text
             
             raise ValueError(f"Unexpected response status: {response.status}")
@@ -219,7 +270,7 @@ class OpenAIAPI:
         reference_foods: Optional[Dict] = None
     ) -> BrainNutrients:
         if isinstance(standard_nutrients, StandardNutrients):
-            standard_nutrients_dict = {k: v for k, v in vars(standard_nutrients).items() 
+            standard_nutrients_dict = {k: v for k, v in field_items(standard_nutrients).items() 
                                     if not k.startswith('_') and v is not None}
         else:
             standard_nutrients_dict = standard_nutrients
@@ -227,10 +278,10 @@ class OpenAIAPI:
         existing_brain_nutrients_dict = {}
         if existing_brain_nutrients:
             if isinstance(existing_brain_nutrients, BrainNutrients):
-                existing_brain_nutrients_dict = {k: v for k, v in vars(existing_brain_nutrients).items() 
+                existing_brain_nutrients_dict = {k: v for k, v in field_items(existing_brain_nutrients).items() 
                                             if not k.startswith('_') and v is not None}
                 if existing_brain_nutrients.omega3:
-                    omega3_dict = {k: v for k, v in vars(existing_brain_nutrients.omega3).items() 
+                    omega3_dict = {k: v for k, v in field_items(existing_brain_nutrients.omega3).items() 
                                 if not k.startswith('_') and v is not None}
                     existing_brain_nutrients_dict['omega3'] = omega3_dict
             else:
@@ -295,10 +346,10 @@ class OpenAIAPI:
                 if hasattr(brain_nutrients, 'to_dict'):
                     brain_nutrients_dict = brain_nutrients.to_dict()
                 else:
-                    brain_nutrients_dict = {k: v for k, v in vars(brain_nutrients).items() 
+                    brain_nutrients_dict = {k: v for k, v in field_items(brain_nutrients).items() 
                                         if not k.startswith('_') and v is not None}
                     if brain_nutrients.omega3:
-                        omega3_dict = {k: v for k, v in vars(brain_nutrients.omega3).items() 
+                        omega3_dict = {k: v for k, v in field_items(brain_nutrients.omega3).items() 
                                     if not k.startswith('_') and v is not None}
                         brain_nutrients_dict["omega3"] = omega3_dict
                         
@@ -308,10 +359,8 @@ class OpenAIAPI:
             
         except Exception as e:
             logger.error(f"Error parsing nutrient prediction response: {e}")
-            error_brain_nutrients = BrainNutrients()
-            setattr(error_brain_nutrients, "_error", str(e))
-            setattr(error_brain_nutrients, "_raw_response", response)
-            return error_brain_nutrients
+            logger.debug("Unparseable nutrient prediction response: %s", response)
+            return BrainNutrients()
 
     @log_execution_time
     async def predict_bioactive_compounds(
@@ -16,7 +16,7 @@ from constants.literature_constants import LITERATURE_COMPLETENESS_DEFAULT, LITE
 from schema.food_data import DataQuality, FoodData, MentalHealthImpact, Metadata, ResearchSupport
 from utils.logging_utils import setup_logging
 from utils.db_utils import PostgresClient
-from utils.document_utils import PDFExtractor, WebPageExtractor
+from utils.document_utils import PDFExtractor, StudyMetadata, WebPageExtractor
 from utils.research_utils import EvidenceClassifier, RelationshipExtractor
 from utils.nutrient_utils import NutrientNameNormalizer
 from config import get_config
@@ -53,13 +53,27 @@ class LiteratureExtractor:
         else:
             raise ValueError("Either pdf_path or url must be provided")
         
+        return self.process_text(text, metadata, pdf_path or url)
+    
+    def process_text(self, text: str, metadata: Optional[StudyMetadata], source: str) -> str:
+        """
+        Extract relationships from already extracted document text and import them.
+        
+        Args:
+            text: Document text
+            metadata: Study metadata
+            source: PDF path or URL, used in log messages
+            
+        Returns:
+            Food ID of the imported data
+        """
         if not text or not metadata:
-            logger.warning(f"Failed to extract text or metadata from {pdf_path}")
+            logger.warning(f"Failed to extract text or metadata from {source}")
             return ""
 
         # Extract relationships
         relationships = self.relationship_extractor.extract_relationships(text, metadata)
-        logger.info(f"Extracted {len(relationships)} relationships from {pdf_path}")
+        logger.info(f"Extracted {len(relationships)} relationships from {source}")
         
         # Convert to schema format
         food_data = self._relationships_to_food_data(relationships)
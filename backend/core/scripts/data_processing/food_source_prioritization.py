@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from schema.food_data import (
     CircadianEffects, ContextualFactors, FoodData, StandardNutrients, BrainNutrients, Omega3, BioactiveCompounds,
@@ -9,7 +11,7 @@ from schema.food_data import (
 )
 
 from utils.data_utils import identify_source, normalize_food_name
-from utils.logging_utils import setup_logging
+from utils.logging_utils import setup_logging, submit_in_context
 from utils.db_utils import PostgresClient
 from utils.data_utils import calculate_completeness
 
@@ -19,6 +21,9 @@ from constants.literature_constants import SOURCE_PRIORITY_MAPPING, SOURCE_CONFI
 
 logger = setup_logging(__name__)
 
+# Food names whose merges are planned concurrently
+MERGE_WORKERS = 4
+
 class SourcePrioritizer:
     """
     Prioritizes and merges data from multiple sources based on data quality.
@@ -605,7 +610,7 @@ class SourcePrioritizer:
             
             if diff > tolerance:
                 # Nutrient values differ too much
-                logger.debug(f"Conflicting nutrient {nutrient}: {value1} vs {value2} (diff: {diff:.2f})")
+                logger.debug("Conflicting nutrient %s: %s vs %s (diff: %.2f)", nutrient, value1, value2, diff)
                 return True
         
         return False
@@ -623,6 +628,18 @@ class SourcePrioritizer:
         return False
     
     def merge_foods_by_name(self, food_name: str) -> Dict[str, str]:
+        return self._save_merge_plan(food_name, self.plan_merge(food_name))
+    
+    def plan_merge(self, food_name: str) -> Optional[Dict[str, Union[str, FoodData]]]:
+        """
+        Group the foods matching a name and build the merged record for each group.
+        
+        Only reads from the database, so several names can be planned at once.
+        
+        Returns:
+            Mapping of group key to either the merged FoodData to save or the ID of
+            the group's only food, or None if planning failed
+        """
         try:
             foods = self.db_client.get_foods_by_name(food_name)
             
@@ -651,7 +668,7 @@ class SourcePrioritizer:
             for group_key, group_foods in groups.items():
                 logger.info(f"Food group '{group_key}' has {len(group_foods)} foods: {[f.name for f in group_foods]}")
             
-            merged_food_ids = {}
+            plan = {}
             
             for group_key, group_foods in groups.items():
                 if len(group_foods) >= 2:
@@ -661,41 +678,72 @@ class SourcePrioritizer:
                     if merged_data:
                         group_id = re.sub(r'[^\w]', '_', group_key).lower()
                         merged_data.food_id = f"merged_{group_id}"
-                        
-                        merged_id = self.db_client.import_food_from_json(merged_data)
-                        merged_food_ids[group_key] = merged_id
-                        logger.info(f"Successfully merged group '{group_key}' as {merged_id}")
+                        plan[group_key] = merged_data
                 else:
-                    merged_food_ids[group_key] = group_foods[0].food_id
+                    plan[group_key] = group_foods[0].food_id
                     logger.info(f"Group '{group_key}' has only 1 food, using existing {group_foods[0].food_id}")
             
-            return merged_food_ids
+            return plan
             
         except Exception as e:
             logger.error(f"Error merging foods for '{food_name}': {e}", exc_info=True)
-            return {}
+            return None
     
-    def merge_all_foods(self, batch_size: int = 100) -> Dict[str, List[str]]:
+    def _save_merge_plan(self, food_name: str, plan: Optional[Dict[str, Union[str, FoodData]]]) -> Dict[str, str]:
+        """Save the merged records of a plan, returning group key to food ID."""
+        if not plan:
+            return {}
+        
         try:
-            food_names_results = self.db_client.execute_query(FOOD_GET_DISTINCT_NAMES)
+            merged_food_ids = {}
             
-            if not food_names_results:
-                logger.warning("No foods found in database")
-                return {}
+            for group_key, entry in plan.items():
+                if isinstance(entry, FoodData):
+                    merged_id = self.db_client.import_food_from_json(entry)
+                    merged_food_ids[group_key] = merged_id
+                    logger.info(f"Successfully merged group '{group_key}' as {merged_id}")
+                else:
+                    merged_food_ids[group_key] = entry
             
-            food_names = [result["name"] for result in food_names_results]
-            logger.info(f"Found {len(food_names)} distinct food names to merge")
+            return merged_food_ids
             
+        except Exception as e:
+            logger.error(f"Error merging foods for '{food_name}': {e}", exc_info=True)
+            return {}
+    
+    def merge_all_foods(self, batch_size: int = 100, max_workers: int = MERGE_WORKERS) -> Dict[str, List[str]]:
+        try:
+            # Stream names through a server-side cursor, batch_size rows per
+            # round trip, instead of materializing every distinct name first.
+            # Planning (reads and merging in memory) runs on a thread pool; plans
+            # are saved here in name order, so overlapping names that resolve to
+            # the same merged food are written in the same order as before.
             all_merged_foods = {}
-            
-            for i in range(0, len(food_names), batch_size):
-                batch = food_names[i:i+batch_size]
+            name_count = 0
+            in_flight = deque()
+            
+            def save_next():
+                food_name, future = in_flight.popleft()
+                merged_groups = self._save_merge_plan(food_name, future.result())
+                if merged_groups:
+                    all_merged_foods[food_name] = merged_groups
+            
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="merge") as executor:
+                for result in self.db_client.stream_query(FOOD_GET_DISTINCT_NAMES, itersize=batch_size, name="merge_food_names"):
+                    name_count += 1
+                    food_name = result["name"]
+                    in_flight.append((food_name, submit_in_context(executor, self.plan_merge, food_name)))
+                    if len(in_flight) >= 2 * max_workers:
+                        save_next()
                 
-                for food_name in batch:
-                    merged_groups = self.merge_foods_by_name(food_name)
-                    if merged_groups:
-                        all_merged_foods[food_name] = merged_groups
+                while in_flight:
+                    save_next()
+            
+            if not name_count:
+                logger.warning("No foods found in database")
+                return {}
             
+            logger.info(f"Processed {name_count} distinct food names")
             total_merged = sum(len(groups) for groups in all_merged_foods.values())
             logger.info(f"Successfully merged foods into {total_merged} groups")
             
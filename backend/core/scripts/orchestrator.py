@@ -19,21 +19,40 @@ import sys
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
+import asyncio
+import codecs
+import hashlib
+import logging
+import queue
+import shutil
+import threading
 import time
-from typing import List, Dict, Optional, Callable, Any, Set
+from functools import cached_property, lru_cache, partial
+from graphlib import TopologicalSorter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import List, Dict, NamedTuple, Optional, Callable, Any, Awaitable, Iterator, Set, Tuple
+
+import ijson
+import orjson
+from aiolimiter import AsyncLimiter
+from psycopg2.extras import Json, execute_values
 
 # Import utility modules
-from utils.logging_utils import setup_logging
+from utils.logging_utils import log_to_step, setup_logging, submit_in_context
 from utils.db_utils import PostgresClient
+from utils.api_utils import close_session
 
 # Import processing modules
-from scripts.data_collection.usda_api import USDAFoodDataCentralAPI, search_and_import as usda_search_and_import
+from scripts.data_collection.usda_api import (
+    FOODS_LIST_MAX_IDS, USDAFoodDataCentralAPI,
+    import_fdc_ids as usda_import_fdc_ids, search_fdc_ids as usda_search_fdc_ids
+)
 from scripts.data_collection.openfoodfacts_api import OpenFoodFactsAPI, search_and_import as off_search_and_import
-from scripts.data_collection.literature_extract import LiteratureExtractor
 from scripts.data_processing.food_data_transformer import FoodDataTransformer
-from scripts.data_processing.ai_enrichment import AIEnrichmentEngine
-from scripts.ai.confidence_calibration_system import ConfidenceCalibrationSystem
-from scripts.data_processing.food_source_prioritization import SourcePrioritizer
+
+from constants.sql_queries import (
+    FOOD_GET_VALIDATION_BATCH, FOOD_GET_VALIDATION_BY_IDS, FOOD_UPDATE_VALIDATION_BATCH
+)
 
 # Import schema models
 from schema.food_data import FoodData
@@ -45,6 +64,78 @@ from config import get_config
 # Initialize logger
 logger = setup_logging(__name__)
 
+# Number of literature sources fetched and parsed concurrently
+LITERATURE_WORKERS = 8
+
+# Cached results kept per step; older entries are pruned
+STEP_CACHE_KEEP = 5
+
+# Steps each pipeline step depends on
+STEP_DEPENDENCIES = {
+    "usda_data_collection": (),
+    "openfoodfacts_data_collection": (),
+    "literature_data_collection": (),
+    "source_merging": ("usda_data_collection", "openfoodfacts_data_collection", "literature_data_collection"),
+    "ai_enrichment": ("source_merging",),
+    "known_answer_validation": ("ai_enrichment",),
+    "confidence_calibration": ("known_answer_validation",),
+}
+
+# Steps that work through whatever rows are still pending in the database.
+# Their output depends on table state the step hash cannot see, so they are
+# never served from the step cache and always run.
+DB_DRIVEN_STEPS = frozenset({"ai_enrichment", "known_answer_validation", "confidence_calibration"})
+
+@lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    """
+    Fingerprint the pipeline's source code.
+    
+    Hashes the path, size and mtime of every module under scripts/, utils/ and
+    schema/ so editing a processor invalidates cached step results.
+    """
+    digest = hashlib.sha256()
+    pending = [os.path.join(project_root, package) for package in ("schema", "scripts", "utils")]
+    while pending:
+        # scandir hands back the entry type with the listing, so only the
+        # modules themselves need a stat and directories are never probed
+        with os.scandir(pending.pop()) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    pending.append(entry.path)
+            elif entry.name.endswith(".py"):
+                stat = entry.stat()
+                digest.update(f"{os.path.relpath(entry.path, project_root)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+def _query_hash(food_query: str) -> str:
+    """Stable key for a search query in the collected_queries table."""
+    return hashlib.blake2b(food_query.encode("utf-8"), digest_size=16).hexdigest()
+
+class FoodRow(NamedTuple):
+    """
+    A food row as fetched for validation.
+    
+    Built straight from plain cursor tuples, so rows carry no per-row key dict.
+    """
+    food_id: str
+    name: str
+    food_data: Dict
+
+def _validate_one(row: FoodRow) -> Tuple[str, str, Optional[List[str]], Optional[str]]:
+    """
+    Validate a single food row.
+    
+    Returns:
+        Tuple of (food_id, name, validation errors, exception message)
+    """
+    try:
+        return row.food_id, row.name, SchemaValidator.validate_food_data(row.food_data), None
+    except Exception as e:
+        return row.food_id, row.name, None, str(e)
+
 class DatabaseOrchestrator:
     """Orchestrates the end-to-end process of building the Nutritional Psychiatry Database."""
         
@@ -62,54 +153,109 @@ class DatabaseOrchestrator:
         
         # Override config with arguments if provided
         self.api_keys = self.config.api_keys or {}
-        self.food_list = food_list or []
-        self.skip_steps = skip_steps or []
-        self.only_steps = only_steps
-        self.batch_size = batch_size or self.config.processing.get("batch_size", 10)
-        self.force_reprocess = force_reprocess if force_reprocess is not None else self.config.processing.get("force_reprocess", False)
-        
-        # Use provided DB client or create a new one
-        self.db_client = db_client or PostgresClient()
+        # --foods and --food-list can name the same food; query each once
+        self.food_list = list(dict.fromkeys(food_list or ()))
+        self.skip_steps = frozenset(skip_steps or ())
+        self.only_steps = frozenset(only_steps) if only_steps else None
+        processing = self.config.processing
+        self.batch_size = batch_size or processing.get("batch_size", 10)
+        self.force_reprocess = force_reprocess if force_reprocess is not None else processing.get("force_reprocess", False)
+        
+        # Use provided DB client or create a new one. Every processor shares this
+        # client's pool, so size it for the concurrent USDA and OpenFoodFacts
+        # batches plus the literature workers running alongside them.
+        self.db_client = db_client or PostgresClient(
+            min_connections=1,
+            max_connections=max(16, 2 * self.batch_size + LITERATURE_WORKERS)
+        )
         # Verify database connection is working
         if not self.db_client.is_connected():
             if not self.db_client.reconnect():
                 raise RuntimeError("Failed to establish database connection")
+        
+        # Create the tables and columns the steps rely on up front, so no step
+        # has to issue DDL on its own hot path
+        self.db_client.migrate_pipeline_schema()
                 
         self.completed_steps: Set[str] = set()
+        
+        # Step results are cached on disk under a hash of the step's inputs
+        self.cache_dir = processing.get("cache_dir", "cache")
+        self._step_hashes: Dict[str, str] = {}
+        self._created_dirs: Set[str] = set()
+        
+        # Journal of the last successful run of each step, next to the cache
+        self._state_file = os.path.join(self.cache_dir, "pipeline_state.json")
+        self._state_lock = threading.Lock()
+        self._state = self._load_state()
+        
+        # Run-wide inputs are the same for every step, so hash them once and
+        # let _step_hash extend a copy with the step's own name and parents
+        self._run_digest = hashlib.sha256(orjson.dumps({
+            "food_list": self.food_list,
+            "batch_size": self.batch_size,
+            "literature_sources": self.config.literature_sources,
+            "api_keys": sorted(name for name, key in self.api_keys.items() if key),
+            "code": _code_fingerprint()
+        }, option=orjson.OPT_SORT_KEYS))
+        
         self._initialize_processors()
     
     def _initialize_processors(self):
         """Initialize all data processors and API clients with shared DB connection."""
         # Get API keys from config if not provided
         usda_api_key = self.api_keys.get("USDA_API_KEY") or self.config.get_api_key("USDA")
-        openai_api_key = self.api_keys.get("OPENAI_API_KEY") or self.config.get_api_key("OPENAI")
         
-        # Initialize API clients
-        self.usda_client = USDAFoodDataCentralAPI(api_key=usda_api_key)
-        self.off_client = OpenFoodFactsAPI()
-        self.literature_client = LiteratureExtractor(db_client=self.db_client)
+        # Initialize API clients. The collectors pace requests with their own
+        # rate limiters, so the clients skip their fixed post-request sleep.
+        self.usda_client = USDAFoodDataCentralAPI(api_key=usda_api_key, rate_limit_delay=0)
+        self.off_client = OpenFoodFactsAPI(rate_limit_delay=0)
         
-        # Initialize processors (pass shared DB client)
+        # Initialize processors (pass shared DB client). The literature,
+        # enrichment, calibration and merging processors are imported on first
+        # use so --only runs don't pay for the subsystems they skip.
         self.transformer = FoodDataTransformer()
-        self.enricher = AIEnrichmentEngine(
-            db_client=self.db_client
-        )
         self.validator = SchemaValidator()
-        self.calibrator = ConfidenceCalibrationSystem(
+    
+    @cached_property
+    def literature_client(self):
+        from scripts.data_collection.literature_extract import LiteratureExtractor
+        return LiteratureExtractor(db_client=self.db_client)
+    
+    @cached_property
+    def enricher(self):
+        from scripts.data_processing.ai_enrichment import AIEnrichmentEngine
+        return AIEnrichmentEngine(
             db_client=self.db_client
         )
-        self.prioritizer = SourcePrioritizer(
+    
+    @cached_property
+    def calibrator(self):
+        from scripts.ai.confidence_calibration_system import ConfidenceCalibrationSystem
+        return ConfidenceCalibrationSystem(
+            db_client=self.db_client,
+            force_reprocess=self.force_reprocess
+        )
+    
+    @cached_property
+    def prioritizer(self):
+        from scripts.data_processing.food_source_prioritization import SourcePrioritizer
+        return SourcePrioritizer(
             db_client=self.db_client
         )
     
     def cleanup(self):
         """Clean up resources when orchestrator is done."""
         try:
+            # Only close the enricher if this run created it
+            if 'enricher' in self.__dict__:
+                self.enricher.close()
             if hasattr(self, 'db_client'):
                 self.db_client.close()
                 logger.info("Database connection pool closed")
+            close_session()
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
     def _should_run_step(self, step_name: str) -> bool:
         """Determine if a step should be run based on skip_steps and only_steps."""
@@ -118,119 +264,381 @@ class DatabaseOrchestrator:
         else:
             return step_name not in self.skip_steps
     
-    def run_step(
-        self, 
-        step_name: str, 
-        step_func: Callable[[], Any], 
-        dependencies: Optional[List[str]] = None
-    ) -> Any:
+    def run_step(self, step_name: str, step_func: Callable[[], Any]) -> Any:
+        """
+        Run a blocking step, or return its cached result.
+        
+        Ordering is handled by _run_step_graph from STEP_DEPENDENCIES, so no
+        dependency check is repeated here.
+        """
+        if not self._should_run_step(step_name):
+            return None
+        
+        digest = self._step_hash(step_name)
+        hit, result = self._load_cached_step(step_name, digest)
+        if hit:
+            return result
+        
+        try:
+            start_time = time.perf_counter()
+            with log_to_step(step_name):
+                result = step_func()
+            logger.info("Step %s finished in %.2fs", step_name, time.perf_counter() - start_time)
+            
+            # Mark as completed
+            self._complete_step(step_name, digest, result)
+            
+            return result
+            
+        except Exception as e:
+            self._log_step_error(step_name, e)
+            raise
+    
+    async def run_step_async(self, step_name: str, step_func: Callable[[], Awaitable[Any]]) -> Any:
+        """Coroutine counterpart of run_step for steps that run on the event loop."""
         if not self._should_run_step(step_name):
             return None
         
-        # Check dependencies
-        if dependencies:
-            missing_deps = [dep for dep in dependencies if dep not in self.completed_steps]
-            if missing_deps:
-                logger.error(f"Cannot run {step_name}: missing dependencies {missing_deps}")
-                return None
+        digest = self._step_hash(step_name)
+        hit, result = self._load_cached_step(step_name, digest)
+        if hit:
+            return result
         
         try:
-            start_time = time.time()
-            result = step_func()
-            end_time = time.time()
+            start_time = time.perf_counter()
+            with log_to_step(step_name):
+                result = await step_func()
+            logger.info("Step %s finished in %.2fs", step_name, time.perf_counter() - start_time)
             
             # Mark as completed
-            self.completed_steps.add(step_name)
+            self._complete_step(step_name, digest, result)
             
             return result
             
         except Exception as e:
-            logger.error(f"Error running step {step_name}: {e}", exc_info=True)
+            self._log_step_error(step_name, e)
             raise
     
+    @staticmethod
+    def _log_step_error(step_name: str, error: Exception):
+        """
+        Log a failed step.
+        
+        The exception is re-raised to the caller, so the full traceback is only
+        formatted here when debug logging is on; otherwise a one-line summary.
+        """
+        logger.error(
+            "Error running step %s: %s: %s", step_name, type(error).__name__, error,
+            exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
+    
+    def _step_hash(self, step_name: str) -> str:
+        """
+        Hash everything a step's output depends on.
+        
+        That is the pipeline inputs plus the hashes of the steps it depends on,
+        so a change anywhere upstream invalidates every downstream step.
+        """
+        digest = self._run_digest.copy()
+        digest.update(orjson.dumps({
+            "step": step_name,
+            "parents": [self._step_hashes.get(dep) for dep in STEP_DEPENDENCIES.get(step_name, ())]
+        }, option=orjson.OPT_SORT_KEYS))
+        return digest.hexdigest()
+    
+    def _step_cache_file(self, step_name: str, digest: str) -> str:
+        return os.path.join(self.cache_dir, step_name, digest, "result.json")
+    
+    def _load_cached_step(self, step_name: str, digest: str) -> Tuple[bool, Any]:
+        """
+        Load a step's result from the cache.
+        
+        Returns:
+            Tuple of (cache hit, cached result)
+        """
+        if self.force_reprocess or step_name in DB_DRIVEN_STEPS:
+            return False, None
+        
+        # Open directly rather than probing first; a miss costs one failed open
+        cache_file = self._step_cache_file(step_name, digest)
+        try:
+            with open(cache_file, "rb") as f:
+                result = orjson.loads(f.read())
+        except FileNotFoundError:
+            return False, None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable cache for %s: %s", step_name, e)
+            return False, None
+        
+        logger.info("Cache hit for %s (%s), skipping", step_name, digest[:12])
+        try:
+            # Refresh the entry so pruning keeps recently used results
+            os.utime(os.path.dirname(cache_file))
+        except OSError:
+            pass
+        self._step_hashes[step_name] = digest
+        self.completed_steps.add(step_name)
+        self._record_step(step_name, digest)
+        return True, result
+    
+    def _load_state(self) -> Dict[str, Dict]:
+        """Load the step journal, logging what an earlier run already finished."""
+        try:
+            with open(self._state_file, "rb") as f:
+                state = orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable pipeline state %s: %s", self._state_file, e)
+            return {}
+        
+        if state and not self.force_reprocess:
+            logger.info("Previous run completed: %s", ", ".join(sorted(state)))
+        return state
+    
+    def _record_step(self, step_name: str, digest: str) -> None:
+        """Record a step's success in the journal, replacing the file atomically."""
+        with self._state_lock:
+            self._state[step_name] = {"hash": digest, "completed_at": time.time()}
+            tmp_file = f"{self._state_file}.tmp"
+            try:
+                self._ensure_dir(self.cache_dir)
+                with open(tmp_file, "wb") as f:
+                    f.write(orjson.dumps(self._state, option=orjson.OPT_INDENT_2))
+                os.replace(tmp_file, self._state_file)
+            except OSError as e:
+                logger.warning("Could not write pipeline state: %s", e)
+    
+    def _complete_step(self, step_name: str, digest: str, result: Any) -> None:
+        """Mark a step as completed and cache its result."""
+        self.completed_steps.add(step_name)
+        self._step_hashes[step_name] = digest
+        self._record_step(step_name, digest)
+        
+        if step_name in DB_DRIVEN_STEPS:
+            return
+        
+        cache_file = self._step_cache_file(step_name, digest)
+        try:
+            data = orjson.dumps(result)
+            self._ensure_dir(os.path.dirname(cache_file))
+            # Exclusive create: an existing entry for this digest is kept as is
+            with open(cache_file, "xb") as f:
+                f.write(data)
+        except FileExistsError:
+            return
+        except (OSError, TypeError) as e:
+            logger.warning("Could not cache result of %s: %s", step_name, e)
+            return
+        
+        self._prune_step_cache(step_name)
+    
+    def _ensure_dir(self, path: str) -> None:
+        """Create a directory the first time a step writes to it."""
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+    
+    def _prune_step_cache(self, step_name: str) -> None:
+        """Drop all but the STEP_CACHE_KEEP most recent cached results of a step."""
+        step_dir = os.path.join(self.cache_dir, step_name)
+        try:
+            entries = sorted(
+                (entry for entry in os.scandir(step_dir) if entry.is_dir()),
+                key=lambda entry: entry.stat().st_mtime_ns,
+                reverse=True
+            )
+            for entry in entries[STEP_CACHE_KEEP:]:
+                shutil.rmtree(entry.path, ignore_errors=True)
+        except OSError as e:
+            logger.warning("Could not prune cache for %s: %s", step_name, e)
+    
     def collect_usda_data(self) -> List[str]:
         """Collect food data from USDA FoodData Central."""
-        step_name = "usda_data_collection"
+        return asyncio.run(self.collect_usda_data_async())
+    
+    async def collect_usda_data_async(self) -> List[str]:
+        """Collect food data from USDA FoodData Central on the running event loop."""
+        # Each query costs one search; details are then fetched in bulk, one
+        # request per FOODS_LIST_MAX_IDS foods. Both go through the same limiter.
+        requests_per_hour = self.config.api_config.get("USDA_REQUESTS_PER_HOUR", 1000)
+        return await self._collect_from_source(
+            "usda_data_collection",
+            "USDA",
+            partial(usda_search_fdc_ids, self.usda_client, limit=1),  # Just get the top match
+            max_rate=requests_per_hour,
+            time_period=3600,
+            bulk_import_fn=partial(
+                usda_import_fdc_ids, self.usda_client, self.db_client,
+                food_transformer=self.transformer, skip_existing=not self.force_reprocess
+            ),
+            bulk_size=FOODS_LIST_MAX_IDS
+        )
+    
+    def collect_openfoodfacts_data(self) -> List[str]:
+        """Collect food data from OpenFoodFacts."""
+        return asyncio.run(self.collect_openfoodfacts_data_async())
+    
+    async def collect_openfoodfacts_data_async(self) -> List[str]:
+        """Collect food data from OpenFoodFacts on the running event loop."""
+        return await self._collect_from_source(
+            "openfoodfacts_data_collection",
+            "OpenFoodFacts",
+            partial(off_search_and_import, self.off_client, self.db_client, food_transformer=self.transformer),
+            max_rate=self.config.api_config.get("OPENFOODFACTS_REQUESTS_PER_MINUTE", 10),
+            time_period=60
+        )
+    
+    async def _collect_from_source(
+        self,
+        step_name: str,
+        source_name: str,
+        import_fn: Callable[[str], List[str]],
+        max_rate: float,
+        time_period: float,
+        bulk_import_fn: Optional[Callable[[List[str]], List[str]]] = None,
+        bulk_size: int = 1
+    ) -> List[str]:
+        """
+        Run a collection step that imports every food in the food list from one source.
         
-        def execute() -> List[str]:
-            saved_ids = []
-
+        Args:
+            step_name: Pipeline step name
+            source_name: Source name used in log messages
+            import_fn: Blocking search-and-import callable taking the food query.
+                When bulk_import_fn is given it only searches, returning source IDs.
+            max_rate: Maximum requests allowed per time period
+            time_period: Rate limit window in seconds
+            bulk_import_fn: Optional blocking callable that imports a chunk of the
+                source IDs found by import_fn in a single request
+            bulk_size: Number of source IDs per bulk_import_fn call
+            
+        Returns:
+            List of imported food IDs
+        """
+        async def execute() -> List[str]:
             if not self.food_list:
                 logger.info("No food list provided.")
                 return []
             
-            # Process in batches
-            for i in range(0, len(self.food_list), self.batch_size):
-                batch = self.food_list[i:i+self.batch_size]
-                logger.info(f"Processing USDA batch {i//self.batch_size + 1}/{(len(self.food_list)-1)//self.batch_size + 1} ({len(batch)} foods)")
-                
-                for food_query in batch:
-                    try:
-                        logger.info(f"Collecting USDA data for {food_query}...")
-                        
-                        # Use the existing search_and_import function
-                        imported_foods = usda_search_and_import(
-                            api_client=self.usda_client,
-                            db_client=self.db_client,
-                            search_term=food_query,
-                            limit=1  # Just get the top match
-                        )
-                        
-                        if imported_foods:
-                            saved_ids.extend(imported_foods)
-                            logger.info(f"Saved USDA data for {food_query} with ID(s): {imported_foods}")
-                        else:
-                            logger.warning(f"No results found for {food_query}")
-                    
-                    except Exception as e:
-                        logger.error(f"Error processing {food_query}: {e}", exc_info=True)
-                        raise
-                
-                # Slight delay between batches to avoid rate limiting
-                if i + self.batch_size < len(self.food_list):
-                    time.sleep(1)
+            # Same long-run rate, but a bucket no deeper than the concurrency
+            # window, so a fresh run can't fire a whole hour's quota at once
+            burst = min(max_rate, self.batch_size)
+            limiter = AsyncLimiter(max_rate=burst, time_period=time_period * burst / max_rate)
+            results = await self._run_concurrent(source_name, import_fn, limiter)
+            if bulk_import_fn is None:
+                return results
             
-            return saved_ids
+            # Different queries can match the same food; import it once
+            source_ids = list(dict.fromkeys(results))
+            return await self._run_bulk_import(source_name, bulk_import_fn, bulk_size, limiter, source_ids)
         
-        return self.run_step(step_name, execute)
+        return await self.run_step_async(step_name, execute)
     
-    def collect_openfoodfacts_data(self) -> List[str]:
-        """Collect food data from OpenFoodFacts."""
-        step_name = "openfoodfacts_data_collection"
+    async def _run_concurrent(
+        self,
+        source_name: str,
+        import_fn: Callable[[str], List[str]],
+        limiter: AsyncLimiter
+    ) -> List[str]:
+        """Import the food list with up to batch_size queries in flight at any time."""
+        saved_ids = []
         
-        def execute() -> List[str]:
-            saved_ids = []
-            self.food_list = ["blueberries"]
-            if not self.food_list:
+        # Queries imported by an earlier run reuse their stored results instead
+        # of searching again
+        query_hashes = {food_query: _query_hash(food_query) for food_query in self.food_list}
+        collected = {}
+        if not self.force_reprocess:
+            try:
+                collected = await asyncio.to_thread(
+                    self.db_client.get_collected_queries, source_name, list(query_hashes.values())
+                )
+            except Exception as e:
+                logger.warning("Could not load collected %s queries: %s", source_name, e)
+        
+        pending = []
+        for food_query, query_hash in query_hashes.items():
+            if query_hash in collected:
+                saved_ids.extend(collected[query_hash])
+            else:
+                pending.append(food_query)
+        if collected:
+            logger.info("Skipping %s %s queries already collected", len(self.food_list) - len(pending), source_name)
+        
+        total = len(pending)
+        
+        # A sliding window rather than fixed batches: a slow query only holds
+        # its own slot instead of stalling the rest of its batch
+        window = asyncio.Semaphore(self.batch_size)
+        
+        async def fetch(food_query: str) -> List[str]:
+            # Retries live in the HTTP client; a query that still fails is
+            # logged and skipped rather than aborting the rest of the run
+            try:
+                async with window:
+                    result = await self._fetch_one(source_name, import_fn, limiter, food_query)
+                if result:
+                    await asyncio.to_thread(
+                        self.db_client.save_collected_query, source_name, query_hashes[food_query], result
+                    )
+                return result
+            except Exception as e:
+                logger.error("Error processing %s: %s", food_query, e, exc_info=True)
                 return []
+        
+        for done, task in enumerate(asyncio.as_completed([fetch(food_query) for food_query in pending]), 1):
+            saved_ids.extend(await task)
             
-            for i in range(0, len(self.food_list), self.batch_size):
-                batch = self.food_list[i:i+self.batch_size]
-                
-                for food_query in batch:
-                    try:
-                        imported_foods = off_search_and_import(
-                            api_client=self.off_client,
-                            db_client=self.db_client,
-                            query=food_query
-                        )
-                        
-                        if imported_foods:
-                            saved_ids.extend(imported_foods)
-                        else:
-                            logger.warning(f"No results found for {food_query}")
-                    
-                    except Exception as e:
-                        logger.error(f"Error processing {food_query}: {e}", exc_info=True)
-                        raise
-                
-                # Slight delay between batches to avoid rate limiting
-                if i + self.batch_size < len(self.food_list):
-                    time.sleep(1)
+            if done % self.batch_size == 0 or done == total:
+                logger.info("Processed %s/%s %s queries", done, total, source_name)
+        
+        return saved_ids
+    
+    async def _run_bulk_import(
+        self,
+        source_name: str,
+        bulk_import_fn: Callable[[List[str]], List[str]],
+        bulk_size: int,
+        limiter: AsyncLimiter,
+        source_ids: List[str]
+    ) -> List[str]:
+        """Import source IDs in chunks of bulk_size, one rate-limited request per chunk."""
+        window = asyncio.Semaphore(self.batch_size)
+        
+        async def import_chunk(chunk: List[str]) -> List[str]:
+            try:
+                async with window, limiter:
+                    return await asyncio.to_thread(bulk_import_fn, chunk)
+            except Exception as e:
+                logger.error("Error importing %s foods %s: %s", source_name, chunk, e, exc_info=True)
+                return []
+        
+        chunks = [source_ids[i:i + bulk_size] for i in range(0, len(source_ids), bulk_size)]
+        logger.info("Importing %s %s foods in %s request(s)", len(source_ids), source_name, len(chunks))
+        
+        results = await asyncio.gather(*(import_chunk(chunk) for chunk in chunks))
+        return [food_id for imported_foods in results for food_id in imported_foods]
+    
+    async def _fetch_one(
+        self,
+        source_name: str,
+        import_fn: Callable[[str], List[str]],
+        limiter: AsyncLimiter,
+        food_query: str
+    ) -> List[str]:
+        """Search and import a single query on a worker thread."""
+        async with limiter:
+            logger.info("Collecting %s data for %s...", source_name, food_query)
             
-            return saved_ids
+            # The API and DB clients are blocking, so run the import off the event loop
+            imported_foods = await asyncio.to_thread(import_fn, food_query)
         
-        return self.run_step(step_name, execute)
+        if imported_foods:
+            logger.info("Collected %s data for %s: %s", source_name, food_query, imported_foods)
+        else:
+            logger.warning("No results found for %s", food_query)
+        
+        return imported_foods or []
     
     def collect_literature_data(self) -> List[str]:
         step_name = "literature_data_collection"
@@ -243,71 +651,210 @@ class DatabaseOrchestrator:
                 logger.warning("No literature sources specified")
                 return []
             
+            pdf_paths = []
+            urls = []
             for source in literature_sources:
-                try:
-                    source_type = source.get("type", "").lower()
-                    source_path = source.get("path", "")
-                    source_food = source.get("food", "")
-                    
-                    if not source_path:
-                        logger.warning(f"Missing path for literature source: {source}")
-                        continue
+                source_type = source.get("type", "").lower()
+                source_path = source.get("path", "")
+                
+                if not source_path:
+                    logger.warning("Missing path for literature source: %s", source)
+                elif source_type == "pdf":
+                    pdf_paths.append(source_path)
+                elif source_type == "url":
+                    urls.append(source_path)
+                else:
+                    logger.warning("Unknown literature source type: %s", source_type)
+            
+            # Each source is an independent fetch/parse/import, so fan them out
+            # and collect ids as they finish. Imports run on threads because the
+            # extractor shares our DB client; PDF parsing is pure-Python CPU work,
+            # so it runs in worker processes first and hands its text over.
+            with ThreadPoolExecutor(max_workers=LITERATURE_WORKERS) as executor:
+                futures = {
+                    submit_in_context(executor, self.literature_client.process_literature, url=url): url
+                    for url in urls
+                }
+                
+                if pdf_paths:
+                    from utils.document_utils import extract_pdf_text
                     
-                    if source_type == "pdf":
-                        food_id = self.literature_client.process_pdf(source_path)
-                        if food_id:
-                            saved_ids.append(food_id)
-                    elif source_type == "url":
-                        food_id = self.literature_client.process_url(source_path)
+                    with ProcessPoolExecutor(max_workers=min(len(pdf_paths), os.cpu_count() or 1)) as pdf_pool:
+                        parsed = {pdf_pool.submit(extract_pdf_text, pdf_path): pdf_path for pdf_path in pdf_paths}
+                        for future in as_completed(parsed):
+                            pdf_path = parsed[future]
+                            try:
+                                text, metadata = future.result()
+                            except Exception as e:
+                                logger.warning("Error parsing literature source %s: %s", pdf_path, e, exc_info=True)
+                                continue
+                            futures[submit_in_context(executor, self.literature_client.process_text, text, metadata, pdf_path)] = pdf_path
+                
+                for future in as_completed(futures):
+                    try:
+                        food_id = future.result()
                         if food_id:
                             saved_ids.append(food_id)
-                    else:
-                        logger.warning(f"Unknown literature source type: {source_type}")
-                
-                except Exception as e:
-                    logger.error(f"Error processing literature source: {e}", exc_info=True)
-                    raise
+                    except Exception as e:
+                        logger.warning("Error processing literature source %s: %s", futures[future], e, exc_info=True)
             
             return saved_ids
         
         return self.run_step(step_name, execute)
     
-    def enrich_with_ai(self) -> List[str]:
-        """Enrich data with AI-generated information."""
+    async def collect_literature_data_async(self) -> List[str]:
+        """Collect literature data without blocking the running event loop."""
+        return await asyncio.to_thread(self.collect_literature_data)
+    
+    def enrich_with_ai(self, on_enriched: Optional[Callable[[str], None]] = None) -> List[str]:
+        """
+        Enrich data with AI-generated information.
+        
+        Args:
+            on_enriched: Optional callback invoked with each food ID as soon as it is enriched
+        """
         step_name = "ai_enrichment"
         
         def execute() -> List[str]:
             # Use the AIEnrichmentEngine's directory processing method
             try:
                 enriched_ids = self.enricher.enrich_directory(
-                    db_client=self.db_client,
-                    limit=None if self.force_reprocess else self.batch_size
+                    limit=None if self.force_reprocess else self.batch_size,
+                    on_enriched=on_enriched
                 )
                 
-                logger.info(f"Successfully enriched {len(enriched_ids)} foods with AI")
+                logger.info("Successfully enriched %s foods with AI", len(enriched_ids))
                 return enriched_ids
                 
             except Exception as e:
-                logger.error(f"Error during AI enrichment: {e}", exc_info=True)
+                logger.error("Error during AI enrichment: %s", e, exc_info=True)
                 raise
         
         return self.run_step(step_name, execute)
     
+    def enrich_and_validate(self) -> List[str]:
+        """
+        Run AI enrichment with known-answer validation trailing it.
+        
+        Each food is queued for validation as soon as it is enriched, so the two
+        steps overlap instead of running back to back. The known_answer_validation
+        step still runs afterwards to sweep up everything else; rows validated
+        here are skipped there because their food_data hash already matches.
+        """
+        if not self._should_run_step("known_answer_validation"):
+            return self.enrich_with_ai()
+        
+        enriched = queue.Queue()
+        validator = threading.Thread(target=self._validate_enriched, args=(enriched,), daemon=True)
+        validator.start()
+        
+        try:
+            return self.enrich_with_ai(on_enriched=enriched.put)
+        finally:
+            enriched.put(None)
+            validator.join()
+    
+    def _validate_enriched(self, enriched: queue.Queue) -> None:
+        """Validate food IDs from the queue in small batches until a None arrives."""
+        validation_results = {
+            "passed": [],
+            "failed": [],
+            "errors": []
+        }
+        
+        # Validated inline on this thread, so no second pool competes with the
+        # enrichment workers
+        finished = False
+        while not finished:
+            food_id = enriched.get()
+            if food_id is None:
+                break
+            
+            # Take whatever else has finished enriching, up to a batch
+            food_ids = [food_id]
+            while len(food_ids) < self.batch_size:
+                try:
+                    food_id = enriched.get_nowait()
+                except queue.Empty:
+                    break
+                if food_id is None:
+                    finished = True
+                    break
+                food_ids.append(food_id)
+            
+            try:
+                with self.db_client.get_cursor(cursor_factory=None) as cursor:
+                    cursor.execute("SET LOCAL synchronous_commit = OFF")
+                    cursor.execute(FOOD_GET_VALIDATION_BY_IDS, (food_ids,))
+                    results = list(map(FoodRow._make, cursor.fetchall()))
+                    if results:
+                        self._validate_locked_batch(cursor, results, validation_results)
+            except Exception as e:
+                # Left unvalidated; the known_answer_validation sweep retries them
+                logger.error("Error validating enriched foods %s: %s", food_ids, e, exc_info=True)
+        
+        logger.info(
+            "Validated %s foods alongside enrichment",
+            len(validation_results['passed']) + len(validation_results['failed'])
+        )
+    
+    def _validate_locked_batch(
+        self,
+        cursor,
+        results: List[FoodRow],
+        validation_results: Dict[str, List]
+    ) -> None:
+        """
+        Validate rows locked by the caller's transaction and record the results.
+        
+        Args:
+            cursor: Cursor of the transaction holding the row locks
+            results: Food rows to validate
+            validation_results: Passed/failed/errors lists to append to
+        """
+        logger.info("Validating batch of %s foods", len(results))
+        
+        outputs = map(_validate_one, results)
+        updates = []
+        
+        for food_id, food_name, errors, error in outputs:
+            if error is not None:
+                logger.error("Error validating %s: %s", food_name, error)
+                validation_results["errors"].append({
+                    "food_id": food_id,
+                    "name": food_name,
+                    "error": error
+                })
+                raise RuntimeError(f"Error validating {food_name}: {error}")
+            
+            updates.append((food_id, Json(errors)))
+            
+            # Track validation results
+            if errors:
+                validation_results["failed"].append({
+                    "food_id": food_id,
+                    "name": food_name,
+                    "errors": errors
+                })
+            else:
+                validation_results["passed"].append({
+                    "food_id": food_id,
+                    "name": food_name
+                })
+        
+        # Write the whole batch's validation status in one statement
+        execute_values(
+            cursor, FOOD_UPDATE_VALIDATION_BATCH, updates,
+            template="(%s, %s::jsonb)", page_size=len(updates)
+        )
+    
     def validate_with_known_answers(self) -> Dict:
         """Validate data against known answers."""
         step_name = "known_answer_validation"
         
         def execute() -> Dict:
-            # Get foods from database that need validation
-            query = """
-            SELECT food_id, name, food_data 
-            FROM foods 
-            WHERE validated = FALSE OR %s
-            LIMIT %s
-            """
-            
             batch_size = self.batch_size
-            offset = 0
+            last_id = ""
             
             validation_results = {
                 "passed": [],
@@ -315,69 +862,37 @@ class DatabaseOrchestrator:
                 "errors": []
             }
             
+            # Validation is a few microseconds of dict checks per row, so it runs
+            # inline; shipping rows to worker processes would cost more than it saves
             while True:
                 try:
-                    # Get batch of foods
-                    results = self.db_client.execute_query(
-                        query, 
-                        (self.force_reprocess, batch_size)
-                    )
-                    
-                    if not results:
-                        logger.info("No more foods to validate")
-                        break
-                    
-                    logger.info(f"Validating batch of {len(results)} foods")
-                    
-                    for item in results:
-                        food_id = item['food_id']
-                        food_name = item['name']
-                        food_data = item['food_data']
+                    # Fetch the next page of foods that need validation: never
+                    # validated, or food_data changed since it was. Keyset
+                    # pagination on food_id never rescans earlier pages, and
+                    # SKIP LOCKED lets several orchestrators validate disjoint
+                    # rows at the same time. Fetch, validate and update happen
+                    # in one transaction so the row locks are held until the
+                    # updates commit.
+                    with self.db_client.get_cursor(cursor_factory=None) as cursor:
+                        # Validation status can be re-derived, so skip the
+                        # WAL flush on commit for these bookkeeping writes
+                        cursor.execute("SET LOCAL synchronous_commit = OFF")
+                        cursor.execute(FOOD_GET_VALIDATION_BATCH, (self.force_reprocess, last_id, batch_size))
+                        results = list(map(FoodRow._make, cursor.fetchall()))
                         
-                        try:
-                            # Validate the food data
-                            errors = self.validator.validate_food_data(food_data)
-                            
-                            # Update validation status in database
-                            with self.db_client.get_cursor() as cursor:
-                                update_query = """
-                                UPDATE foods
-                                SET validated = TRUE, validation_errors = %s, last_updated = NOW()
-                                WHERE food_id = %s
-                                RETURNING food_id
-                                """
-                                
-                                cursor.execute(update_query, (errors, food_id))
-                                
-                            # Track validation results
-                            if errors:
-                                validation_results["failed"].append({
-                                    "food_id": food_id,
-                                    "name": food_name,
-                                    "errors": errors
-                                })
-                            else:
-                                validation_results["passed"].append({
-                                    "food_id": food_id,
-                                    "name": food_name
-                                })
-                                
-                        except Exception as e:
-                            logger.error(f"Error validating {food_name}: {e}", exc_info=True)
-                            validation_results["errors"].append({
-                                "food_id": food_id,
-                                "name": food_name,
-                                "error": str(e)
-                            })
-                            raise
+                        if not results:
+                            logger.info("No more foods to validate")
+                            break
+                        
+                        self._validate_locked_batch(cursor, results, validation_results)
                     
-                    offset += batch_size
+                    last_id = results[-1].food_id
                     
                     if len(results) < batch_size:
                         break
                 
                 except Exception as e:
-                    logger.error(f"Error processing validation batch: {e}", exc_info=True)
+                    logger.error("Error processing validation batch: %s", e, exc_info=True)
                     raise
             
             return validation_results
@@ -392,11 +907,11 @@ class DatabaseOrchestrator:
             # Use the ConfidenceCalibrationSystem to calibrate the database
             try:
                 stats = self.calibrator.calibrate_database()
-                logger.info(f"Confidence calibration complete: {stats['successfully_calibrated']} succeeded, {stats['failed']} failed")
+                logger.info("Confidence calibration complete: %s succeeded, %s failed", stats['successfully_calibrated'], stats['failed'])
                 return stats
                 
             except Exception as e:
-                logger.error(f"Error during confidence calibration: {e}", exc_info=True)
+                logger.error("Error during confidence calibration: %s", e, exc_info=True)
                 raise
                 
         return self.run_step(step_name, execute)
@@ -409,75 +924,153 @@ class DatabaseOrchestrator:
             # Use the SourcePrioritizer to merge all foods by name
             try:
                 merged_ids = self.prioritizer.merge_all_foods(batch_size=self.batch_size)
-                logger.info(f"Successfully merged {len(merged_ids)} foods")
+                logger.info("Successfully merged %s foods", len(merged_ids))
                 return merged_ids
                 
             except Exception as e:
-                logger.error(f"Error during source merging: {e}", exc_info=True)
+                logger.error("Error during source merging: %s", e, exc_info=True)
                 raise
         
         return self.run_step(step_name, execute)
     
     def run_all(self) -> bool:
-        steps = [
-            ("usda_data_collection", self.collect_usda_data, []),
-            ("openfoodfacts_data_collection", self.collect_openfoodfacts_data, []),
-            ("literature_data_collection", self.collect_literature_data, []),
-            ("source_merging", self.merge_sources, ["usda_data_collection", "openfoodfacts_data_collection", "literature_data_collection"]),
-            ("ai_enrichment", self.enrich_with_ai, ["source_merging"]),     ("known_answer_validation", self.validate_with_known_answers, ["ai_enrichment"]),
-            ("confidence_calibration", self.calibrate_confidence, ["known_answer_validation"])
-        ]
+        return asyncio.run(self._run_step_graph())
+    
+    async def _run_step_graph(self) -> bool:
+        """
+        Run every step in dependency order.
+        
+        Steps are released by a topological sorter over STEP_DEPENDENCIES and
+        run concurrently once ready: coroutine steps on the event loop,
+        blocking steps in worker threads.
         
+        Returns:
+            True if every step succeeded
+        """
+        step_funcs = {
+            "usda_data_collection": self.collect_usda_data_async,
+            "openfoodfacts_data_collection": self.collect_openfoodfacts_data_async,
+            "literature_data_collection": self.collect_literature_data_async,
+            "source_merging": self.merge_sources,
+            "ai_enrichment": self.enrich_and_validate,
+            "known_answer_validation": self.validate_with_known_answers,
+            "confidence_calibration": self.calibrate_confidence
+        }
+        
+        sorter = TopologicalSorter(STEP_DEPENDENCIES)
+        sorter.prepare()
+        
+        # Start each step as soon as its own dependencies finish rather than
+        # waiting for the rest of its generation
+        running: Dict[asyncio.Task, str] = {}
         success = True
-        for step_name, step_func, dependencies in steps:
-            result = self.run_step(step_name, step_func, dependencies)
-            if result is None:
-                success = False
-                logger.error(f"Step {step_name} failed")
+        # After a failure nothing new starts, but steps in flight finish
+        while sorter.is_active():
+            if success:
+                for step_name in sorter.get_ready():
+                    running[asyncio.create_task(self._await_step(step_funcs[step_name]))] = step_name
+            if not running:
                 break
+            
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step_name = running.pop(task)
+                if task.exception() is not None or task.result() is None:
+                    success = False
+                    logger.error("Step %s failed", step_name)
+                else:
+                    sorter.done(step_name)
         
         return success
     
+    @staticmethod
+    async def _await_step(step_func: Callable[[], Any]) -> Any:
+        """Run a step on the event loop if it is a coroutine, else in a thread."""
+        if asyncio.iscoroutinefunction(step_func):
+            return await step_func()
+        return await asyncio.to_thread(step_func)
+    
     def run_interactive(self):
         """Run the pipeline interactively."""
         print("\nNutritional Psychiatry Database Pipeline")
         print("=====================================")
         
+        # Menu key -> (label, step), built once rather than re-dispatched per choice
+        actions = {
+            "1": ("Collect USDA data", self.collect_usda_data),
+            "2": ("Collect OpenFoodFacts data", self.collect_openfoodfacts_data),
+            "3": ("Collect literature data", self.collect_literature_data),
+            "4": ("Merge sources", self.merge_sources),
+            "5": ("Enrich with AI", self.enrich_with_ai),
+            "6": ("Validate with known answers", self.validate_with_known_answers),
+            "7": ("Calibrate confidence", self.calibrate_confidence),
+            "8": ("Run all steps", self.run_all)
+        }
+        menu = "\n".join(f"{key}. {label}" for key, (label, _) in actions.items())
+        
         while True:
             print("\nAvailable steps:")
-            print("1. Collect USDA data")
-            print("2. Collect OpenFoodFacts data")
-            print("3. Collect literature data")
-            print("4. Merge sources")
-            print("5. Enrich with AI")
-            print("6. Validate with known answers")
-            print("7. Calibrate confidence")
-            print("8. Run all steps")
+            print(menu)
             print("0. Exit")
             
-            choice = input("\nEnter your choice (0-9): ")
+            choice = input(f"\nEnter your choice (0-{len(actions)}): ")
             
             if choice == "0":
                 break
-            elif choice == "1":
-                self.collect_usda_data()
-            elif choice == "2":
-                self.collect_openfoodfacts_data()
-            elif choice == "3":
-                self.collect_literature_data()
-            elif choice == "4":
-                self.merge_sources()
-            elif choice == "5":
-                self.enrich_with_ai()
-            elif choice == "6":
-                self.validate_with_known_answers()
-            elif choice == "7":
-                self.calibrate_confidence()
-            elif choice == "8":
-                self.run_all()
+            
+            action = actions.get(choice)
+            if action:
+                action[1]()
             else:
                 print("Invalid choice. Please try again.")
 
+def iter_food_list(path: str) -> Iterator[str]:
+    """
+    Stream food queries from a JSON file without building the whole document.
+    
+    Args:
+        path: JSON file holding either a list of food names or {"foods": [...]}
+        
+    Yields:
+        Food queries; entries that are not strings are skipped with a warning
+    """
+    with open(path, "rb") as f:
+        # Skip a UTF-8 BOM; ijson copes with any leading whitespace itself
+        start = len(codecs.BOM_UTF8) if f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8 else 0
+        f.seek(start)
+        # The first parse event tells a bare list from {"foods": [...]}, then
+        # rewind for the item stream
+        _, root_event, _ = next(ijson.parse(f), (None, None, None))
+        f.seek(start)
+        prefix = "item" if root_event == "start_array" else "foods.item"
+        for food in ijson.items(f, prefix):
+            if isinstance(food, str):
+                yield food
+            else:
+                logger.warning("Skipping non-string food list entry in %s: %r", path, food)
+
+def load_food_list(path: str) -> List[str]:
+    """
+    Load food queries from a JSON file.
+    
+    Every collection step walks the list and it is part of the step cache key,
+    so it is kept in memory; only the queries themselves are, never the parsed
+    document around them.
+    
+    Args:
+        path: JSON file holding either a list of food names or {"foods": [...]}
+        
+    Returns:
+        List of food queries
+    """
+    stat = os.stat(path)
+    return list(_parse_food_list(os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+
+@lru_cache(maxsize=8)
+def _parse_food_list(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    # Keyed on mtime and size so an edited file is parsed again
+    return tuple(iter_food_list(path))
+
 def main():
     """Main function."""
     import argparse
@@ -485,6 +1078,7 @@ def main():
     parser = argparse.ArgumentParser(description="Nutritional Psychiatry Database Pipeline")
     parser.add_argument("--config", help="Path to configuration file")
     parser.add_argument("--foods", nargs="+", help="List of foods to process")
+    parser.add_argument("--food-list", help="JSON file with foods to process")
     parser.add_argument("--skip", nargs="+", help="Steps to skip")
     parser.add_argument("--only", nargs="+", help="Steps to run (ignores skip)")
     parser.add_argument("--batch-size", type=int, help="Batch size for processing")
@@ -497,17 +1091,18 @@ def main():
     
     orchestrator = None
     try:
-        # Create DB client first so we can share it
-        db_client = PostgresClient()
+        foods = args.foods
+        if args.food_list:
+            foods = (foods or []) + load_food_list(args.food_list)
         
+        # The orchestrator creates one pooled DB client and shares it with every processor
         orchestrator = DatabaseOrchestrator(
             config_file=args.config,
-            food_list=args.foods,
+            food_list=foods,
             skip_steps=args.skip,
             only_steps=args.only,
             batch_size=args.batch_size,
-            force_reprocess=args.force,
-            db_client=db_client  # Pass the shared DB client
+            force_reprocess=args.force
         )
         
         if args.interactive:
@@ -518,7 +1113,7 @@ def main():
                 sys.exit(1)
     
     except Exception as e:
-        logger.error(f"Error running orchestrator: {e}", exc_info=True)
+        logger.error("Error running orchestrator: %s", e, exc_info=True)
         sys.exit(1)
     finally:
         # Ensure cleanup happens even if exception occurs
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Tests import modules the way the scripts do: core packages (utils, schema,
+# scripts) and backend packages (config, constants) as top-level imports
+CORE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [CORE_DIR, os.path.dirname(CORE_DIR)]
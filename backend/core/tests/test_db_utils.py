@@ -0,0 +1,50 @@
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from schema.food_data import FoodData
+from utils.db_utils import PostgresClient
+
+FOOD = {
+    "food_id": "usda_1",
+    "name": "Spinach",
+    "category": "Vegetables",
+    "standard_nutrients": {"calories": 23.0},
+    "data_quality": {"completeness": 0.5, "overall_confidence": 5},
+    "metadata": {"version": "0.1.0", "created": "2025-01-01", "last_updated": "2025-01-01"},
+}
+
+@pytest.fixture
+def client():
+    with mock.patch("utils.db_utils.pool.ThreadedConnectionPool"):
+        client = PostgresClient(connection_string="postgresql://test")
+    written = []
+    
+    def write_food(cursor, food):
+        written.append(food)
+        return food.food_id
+    
+    with mock.patch.object(client, "_write_food", side_effect=write_food):
+        client.written = written
+        yield client
+
+@pytest.mark.parametrize("food_json", [
+    FOOD,
+    FoodData.from_dict(FOOD).to_json(),
+    FoodData.from_dict(FOOD),
+], ids=["dict", "json", "fooddata"])
+def test_import_food_from_json(client, food_json):
+    assert client.import_food_from_json(food_json) == "usda_1"
+    assert isinstance(client.written[0], FoodData)
+    assert client.written[0].name == "Spinach"
+
+def test_import_foods_from_json_mixed_inputs(client):
+    foods_json = [FOOD, FoodData.from_dict(FOOD).to_json(), FoodData.from_dict(FOOD)]
+    
+    assert client.import_foods_from_json(foods_json) == ["usda_1"] * 3
+    assert all(isinstance(food, FoodData) for food in client.written)
+
+def test_import_foods_from_json_skips_unparseable(client):
+    assert client.import_foods_from_json(["not json", FOOD]) == ["usda_1"]
@@ -5,11 +5,53 @@ API request utilities for the Nutritional Psychiatry Database project.
 
 import time
 import logging
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
+from tenacity import (
+    RetryCallState, Retrying, before_sleep_log, retry_if_exception,
+    stop_after_attempt, wait_exponential_jitter
+)
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections kept per host by the shared session
+HTTP_POOL_MAXSIZE = 32
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session.
+    
+    Every API client sends its requests through this one session so DNS,
+    TCP and TLS setup are paid once per host rather than once per call.
+    
+    Returns:
+        Shared requests session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+def close_session():
+    """Close the shared HTTP session and its pooled connections, if one was opened."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
 def make_request(
     url: str,
     params: Optional[Dict[str, Any]] = None,
@@ -17,22 +59,24 @@ def make_request(
     method: str = "GET",
     retry_count: int = 3,
     retry_delay: float = 1.0,
-    timeout: int = 30
-) -> Dict[str, Any]:
+    timeout: int = 30,
+    json_body: Optional[Any] = None
+) -> Any:
     """
     Make an API request with retry logic and proper error handling.
     
     Args:
         url: API endpoint URL
-        params: Query parameters
+        params: Query parameters (sent as the JSON body of a POST unless json_body is given)
         headers: Request headers
         method: HTTP method (GET, POST, etc.)
-        retry_count: Number of retry attempts
-        retry_delay: Initial delay between retries (exponential backoff)
+        retry_count: Maximum number of attempts
+        retry_delay: Initial delay between retries (exponential backoff with jitter)
         timeout: Request timeout in seconds
+        json_body: JSON body for a POST; when set, params stay in the query string
     
     Returns:
-        JSON response as dictionary
+        Decoded JSON response
     
     Raises:
         requests.exceptions.RequestException: For request failures after retries
@@ -40,46 +84,69 @@ def make_request(
     params = params or {}
     headers = headers or {}
     
-    attempt = 0
-    while attempt < retry_count:
-        try:
-            if method.upper() == "GET":
-                response = requests.get(
-                    url, 
-                    params=params, 
-                    headers=headers,
-                    timeout=timeout
-                )
-            elif method.upper() == "POST":
-                response = requests.post(
-                    url, 
-                    json=params, 
-                    headers=headers,
-                    timeout=timeout
-                )
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            # Raise for HTTP errors
-            response.raise_for_status()
-            
-            # Return JSON response
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            attempt += 1
-            
-            # If it's a rate limit issue, wait longer
-            if hasattr(e, 'response') and e.response and e.response.status_code == 429:
-                retry_delay *= 3  # Wait much longer for rate limits
-            
-            if attempt < retry_count:
-                logger.warning(f"Request failed: {e}. Retrying in {retry_delay:.1f}s ({attempt}/{retry_count})")
-                time.sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
-            else:
-                logger.error(f"Request failed after {retry_count} attempts: {e}")
-                raise
+    if method.upper() not in ("GET", "POST"):
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    backoff = wait_exponential_jitter(initial=retry_delay, max=60)
+    
+    def wait(retry_state: RetryCallState) -> float:
+        # Never retry sooner than a 429's Retry-After asks
+        return max(backoff(retry_state), _retry_after(retry_state.outcome.exception()))
+    
+    retrying = Retrying(
+        retry=retry_if_exception(_is_transient),
+        stop=stop_after_attempt(retry_count),
+        wait=wait,
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    
+    session = get_session()
+    
+    try:
+        for attempt in retrying:
+            with attempt:
+                if method.upper() == "GET":
+                    response = session.get(
+                        url, 
+                        params=params, 
+                        headers=headers,
+                        timeout=timeout
+                    )
+                else:
+                    response = session.post(
+                        url, 
+                        json=params if json_body is None else json_body, 
+                        params=None if json_body is None else params,
+                        headers=headers,
+                        timeout=timeout
+                    )
+                
+                # Raise for HTTP errors
+                response.raise_for_status()
+                
+                # Return JSON response; orjson parses the raw bytes directly
+                return orjson.loads(response.content)
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Request failed after {retrying.statistics.get('attempt_number', 1)} attempt(s): {e}")
+        raise
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether a request failure is worth retrying (network errors, 429 and 5xx)."""
+    if isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return False
+
+def _retry_after(exc: Optional[BaseException]) -> float:
+    """Seconds requested by a 429 response's Retry-After header, or 0."""
+    response = getattr(exc, "response", None)
+    if response is not None and response.status_code == 429:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+    return 0.0
 
 def make_api_request(
     url: str,
@@ -91,8 +158,9 @@ def make_api_request(
     retry_count: int = 3,
     retry_delay: float = 1.0,
     timeout: int = 30,
-    rate_limit_delay: float = 0.5
-) -> Dict[str, Any]:
+    rate_limit_delay: float = 0.5,
+    json_body: Optional[Any] = None
+) -> Any:
     """
     Make an API request.
     
@@ -107,9 +175,10 @@ def make_api_request(
         retry_delay: Initial delay between retries
         timeout: Request timeout in seconds
         rate_limit_delay: Delay after request to respect rate limits
+        json_body: JSON body for a POST; when set, params stay in the query string
         
     Returns:
-        JSON response as dictionary
+        Decoded JSON response
     """
     if api_key:
         if params is None:
@@ -123,7 +192,8 @@ def make_api_request(
         method=method,
         retry_count=retry_count,
         retry_delay=retry_delay,
-        timeout=timeout
+        timeout=timeout,
+        json_body=json_body
     )
     
     # Respect rate limits
@@ -1,10 +1,24 @@
 import re
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Tuple
 
 from constants.food_data_constants import BRAIN_NUTRIENTS_FIELDS, STD_NUTRIENT_FIELDS, OMEGA3_FIELDS
 from schema.food_data import FoodData
 
+# Characters not allowed in food IDs. The ASCII ones are replaced with one
+# str.translate pass; the regex only runs for IDs with non-ASCII characters.
+_ID_INVALID_RE = re.compile(r'[^\w\d]')
+_ID_ASCII_TRANS = str.maketrans({
+    c: '_' for c in map(chr, range(128)) if not (c.isalnum() or c == '_')
+})
+
 def generate_food_id(source: str, original_id: str) -> str:
-    clean_id = re.sub(r'[^\w\d]', '_', str(original_id))
+    original_id = str(original_id)
+    if original_id.isascii():
+        clean_id = original_id.translate(_ID_ASCII_TRANS)
+    else:
+        clean_id = _ID_INVALID_RE.sub('_', original_id)
     return f"{source.lower()}_{clean_id}"
 
 def identify_source(food_data: FoodData) -> str:
@@ -29,6 +43,29 @@ def identify_source(food_data: FoodData) -> str:
     
     return "unknown"
 
+@lru_cache(maxsize=None)
+def _values_getter(field_names: Tuple[str, ...]) -> Callable[[Any], Tuple]:
+    """
+    Build a callable returning the values of field_names as one tuple.
+    
+    attrgetter with several names fetches them all in a single C call; the
+    getter is cached per field set, so it is built once per call site.
+    """
+    if not field_names:
+        return lambda obj: ()
+    if len(field_names) == 1:
+        getter = attrgetter(field_names[0])
+        return lambda obj: (getter(obj),)
+    return attrgetter(*field_names)
+
+def _count_filled(obj: Any, field_names: Tuple[str, ...]) -> int:
+    try:
+        values = _values_getter(field_names)(obj)
+    except AttributeError:
+        # A caller-supplied name the object doesn't have counts as unfilled
+        return sum(1 for n in field_names if getattr(obj, n, None) is not None)
+    return len(values) - values.count(None)
+
 def calculate_completeness(merged_data: FoodData, required_fields=None) -> float:
     total_fields = 0
     filled_fields = 0
@@ -44,9 +81,8 @@ def calculate_completeness(merged_data: FoodData, required_fields=None) -> float
     
     # Check standard nutrients
     if merged_data.standard_nutrients:
-        std_nutrients = merged_data.standard_nutrients
         total_fields += len(std_nutrient_fields)
-        filled_fields += sum(1 for n in std_nutrient_fields if hasattr(std_nutrients, n) and getattr(std_nutrients, n) is not None)
+        filled_fields += _count_filled(merged_data.standard_nutrients, tuple(std_nutrient_fields))
     
     # Check brain nutrients
     if merged_data.brain_nutrients:
@@ -54,12 +90,12 @@ def calculate_completeness(merged_data: FoodData, required_fields=None) -> float
         
         # Check main brain nutrient fields
         total_fields += len(brain_nutrient_fields)
-        filled_fields += sum(1 for n in brain_nutrient_fields if hasattr(brain_nutrients, n) and getattr(brain_nutrients, n) is not None)
+        filled_fields += _count_filled(brain_nutrients, tuple(brain_nutrient_fields))
         
         # Check omega-3 fields if present
         if brain_nutrients.omega3:
             total_fields += len(omega3_fields)
-            filled_fields += sum(1 for n in omega3_fields if hasattr(brain_nutrients.omega3, n) and getattr(brain_nutrients.omega3, n) is not None)
+            filled_fields += _count_filled(brain_nutrients.omega3, tuple(omega3_fields))
     
     if total_fields > 0:
         return round(filled_fields / total_fields, 2)
@@ -9,7 +9,8 @@ and data import/export operations.
 import json
 import logging
 import time
-from typing import Dict, List, Optional, Union, Tuple, Any
+import orjson
+from typing import Dict, Iterator, List, Optional, Set, Union, Tuple, Any
 from contextlib import contextmanager
 from datetime import datetime
 import psycopg2
@@ -53,6 +54,9 @@ class PostgresClient:
             connection_string = self._build_connection_string_from_env()
         
         self.connection_string = connection_string
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self._schema_migrated = False
         
         # Initialize connection pool
         try:
@@ -89,6 +93,10 @@ class PostgresClient:
         """
         Get a connection from the pool.
         
+        The connection is always returned to the pool on exit. If the block
+        raises, any open transaction is rolled back first so the next borrower
+        does not inherit an aborted transaction.
+        
         Args:
             cursor_factory: Optional cursor factory
             
@@ -101,6 +109,10 @@ class PostgresClient:
             if cursor_factory:
                 connection.cursor_factory = cursor_factory
             yield connection
+        except Exception:
+            if connection:
+                connection.rollback()
+            raise
         finally:
             if connection:
                 self.connection_pool.putconn(connection)
@@ -170,7 +182,8 @@ class PostgresClient:
                         pass
                     
                 self.connection_pool = pool.ThreadedConnectionPool(
-                    1, 10,
+                    self.min_connections,
+                    self.max_connections,
                     self.connection_string
                 )
                 
@@ -213,6 +226,39 @@ class PostgresClient:
             logger.error(f"Query execution failed: {e}")
             raise
     
+    def stream_query(
+        self,
+        query: str,
+        params: Optional[Union[Tuple, Dict]] = None,
+        itersize: int = 1000,
+        name: str = "stream_cursor"
+    ) -> Iterator[Dict]:
+        """
+        Stream query results through a server-side (named) cursor.
+        
+        Rows are pulled from the server ``itersize`` at a time, so memory use
+        stays flat however large the result set is.
+        
+        Args:
+            query: SQL query
+            params: Query parameters
+            itersize: Number of rows fetched per network round trip
+            name: Name of the server-side cursor
+            
+        Yields:
+            Result rows as dictionaries
+        """
+        with self.get_connection() as connection:
+            try:
+                with connection.cursor(name=name, cursor_factory=RealDictCursor) as cursor:
+                    cursor.itersize = itersize
+                    cursor.execute(query, params or ())
+                    yield from cursor
+            finally:
+                # Read-only: end the transaction that holds the cursor open, even
+                # when the caller stops iterating early
+                connection.rollback()
+    
     def batch_insert(
         self, 
         table: str, 
@@ -232,6 +278,15 @@ class PostgresClient:
             logger.error(f"Batch insert failed: {e}")
             raise
     
+    @staticmethod
+    def _to_food(food_json: Union[Dict, str, FoodData]) -> FoodData:
+        """Coerce a dictionary or JSON string to FoodData; FoodData passes through."""
+        if isinstance(food_json, str):
+            return FoodData.from_json(food_json)
+        elif isinstance(food_json, dict):
+            return FoodData.from_dict(food_json)
+        return food_json
+    
     def import_food_from_json(self, food_json: Union[Dict, str, FoodData]) -> str:
         """
         Import a food from JSON data into the normalized database schema.
@@ -243,171 +298,220 @@ class PostgresClient:
             Food ID of the imported food
         """
         try:
-            if isinstance(food_json, str):
-                food_data = json.loads(food_json)
-                food = FoodData.from_dict(food_data)
-            elif isinstance(food_json, dict):
-                food = FoodData.from_dict(food_json)
-            else:
-                food = food_json
+            food = self._to_food(food_json)
             
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
-                    cursor.execute(FOOD_UPSERT, (
-                        food.food_id, 
-                        food.name, 
-                        food.description, 
-                        food.category,
-                        food.processed if hasattr(food, 'processed') else False,
-                        food.validated if hasattr(food, 'validated') else False
-                    ))
-                    
-                    food_id = cursor.fetchone()[0]
-                    
-                    if food.standard_nutrients:
-                        sn = food.standard_nutrients
-                        cursor.execute(STANDARD_NUTRIENTS_UPSERT, (
-                            food_id, 
-                            getattr(sn, 'calories', None), 
-                            getattr(sn, 'protein_g', None), 
-                            getattr(sn, 'carbohydrates_g', None), 
-                            getattr(sn, 'fat_g', None), 
-                            getattr(sn, 'fiber_g', None),
-                            getattr(sn, 'sugars_g', None), 
-                            getattr(sn, 'sugars_added_g', None), 
-                            getattr(sn, 'calcium_mg', None), 
-                            getattr(sn, 'iron_mg', None), 
-                            getattr(sn, 'magnesium_mg', None),
-                            getattr(sn, 'phosphorus_mg', None), 
-                            getattr(sn, 'potassium_mg', None), 
-                            getattr(sn, 'sodium_mg', None), 
-                            getattr(sn, 'zinc_mg', None), 
-                            getattr(sn, 'copper_mg', None),
-                            getattr(sn, 'manganese_mg', None), 
-                            getattr(sn, 'selenium_mcg', None), 
-                            getattr(sn, 'vitamin_c_mg', None), 
-                            getattr(sn, 'vitamin_a_iu', None)
-                        ))
-                    
-                    if food.brain_nutrients:
-                        bn = food.brain_nutrients
-                        cursor.execute(BRAIN_NUTRIENTS_UPSERT, (
-                            food_id, 
-                            getattr(bn, 'tryptophan_mg', None), 
-                            getattr(bn, 'tyrosine_mg', None), 
-                            getattr(bn, 'vitamin_b6_mg', None), 
-                            getattr(bn, 'folate_mcg', None),
-                            getattr(bn, 'vitamin_b12_mcg', None), 
-                            getattr(bn, 'vitamin_d_mcg', None), 
-                            getattr(bn, 'magnesium_mg', None), 
-                            getattr(bn, 'zinc_mg', None), 
-                            getattr(bn, 'iron_mg', None),
-                            getattr(bn, 'selenium_mcg', None), 
-                            getattr(bn, 'choline_mg', None)
-                        ))
-                        
-                        if hasattr(bn, 'omega3') and bn.omega3:
-                            o3 = bn.omega3
-                            cursor.execute(OMEGA3_UPSERT, (
-                                food_id, 
-                                getattr(o3, 'total_g', None), 
-                                getattr(o3, 'epa_mg', None), 
-                                getattr(o3, 'dha_mg', None), 
-                                getattr(o3, 'ala_mg', None),
-                                getattr(o3, 'confidence', None)
-                            ))
-                    
-                    if hasattr(food, 'bioactive_compounds') and food.bioactive_compounds:
-                        bc = food.bioactive_compounds
-                        cursor.execute(BIOACTIVE_COMPOUNDS_UPSERT, (
-                            food_id, 
-                            getattr(bc, 'polyphenols_mg', None), 
-                            getattr(bc, 'flavonoids_mg', None), 
-                            getattr(bc, 'anthocyanins_mg', None),
-                            getattr(bc, 'carotenoids_mg', None), 
-                            getattr(bc, 'probiotics_cfu', None), 
-                            getattr(bc, 'prebiotic_fiber_g', None)
-                        ))
-                    
-                    if hasattr(food, 'serving_info') and food.serving_info:
-                        si = food.serving_info
-                        cursor.execute(SERVING_INFO_UPSERT, (
-                            food_id, 
-                            getattr(si, 'serving_size', None), 
-                            getattr(si, 'serving_unit', None), 
-                            getattr(si, 'household_serving', None)
-                        ))
-                    
-                    if hasattr(food, 'data_quality') and food.data_quality:
-                        dq = food.data_quality
-                        sp = None
-                        if hasattr(dq, 'source_priority') and dq.source_priority:
-                            if hasattr(dq.source_priority, '__dict__'):
-                                sp = json.dumps(dq.source_priority.__dict__)
-                            else:
-                                sp = json.dumps(dq.source_priority)
-                        
-                        cursor.execute(DATA_QUALITY_UPSERT, (
-                            food_id, 
-                            getattr(dq, 'completeness', None), 
-                            getattr(dq, 'overall_confidence', None),
-                            getattr(dq, 'brain_nutrients_source', None), 
-                            getattr(dq, 'impacts_source', None), 
-                            sp
-                        ))
-                    
-                    if hasattr(food, 'metadata') and food.metadata:
-                        md = food.metadata
-                        source_urls = json.dumps(md.source_urls) if hasattr(md, 'source_urls') and md.source_urls else '[]'
-                        source_ids = json.dumps(md.source_ids) if hasattr(md, 'source_ids') and md.source_ids else '{}'
-                        tags = json.dumps(md.tags) if hasattr(md, 'tags') and md.tags else '[]'
-                        
-                        cursor.execute(METADATA_UPSERT, (
-                            food_id, 
-                            getattr(md, 'version', None), 
-                            getattr(md, 'created', None), 
-                            getattr(md, 'last_updated', None),
-                            getattr(md, 'image_url', None), 
-                            source_urls, 
-                            source_ids, 
-                            tags
-                        ))
-                    
-                    if hasattr(food, 'mental_health_impacts') and food.mental_health_impacts:
-                        cursor.execute(MENTAL_HEALTH_IMPACTS_DELETE, (food_id,))
-                        
-                        for impact in food.mental_health_impacts:
-                            cursor.execute(MENTAL_HEALTH_IMPACT_INSERT, (
-                                food_id, 
-                                getattr(impact, 'impact_type', None), 
-                                getattr(impact, 'direction', None), 
-                                getattr(impact, 'mechanism', None),
-                                getattr(impact, 'strength', None), 
-                                getattr(impact, 'confidence', None), 
-                                getattr(impact, 'time_to_effect', None), 
-                                getattr(impact, 'research_context', None), 
-                                getattr(impact, 'notes', None)
-                            ))
-                            
-                            impact_id = cursor.fetchone()[0]
-                            
-                            if hasattr(impact, 'research_support') and impact.research_support:
-                                for support in impact.research_support:
-                                    cursor.execute(RESEARCH_SUPPORT_INSERT, (
-                                        impact_id, 
-                                        getattr(support, 'citation', None), 
-                                        getattr(support, 'doi', None), 
-                                        getattr(support, 'url', None),
-                                        getattr(support, 'study_type', None), 
-                                        getattr(support, 'year', None)
-                                    ))
-                    
+                    food_id = self._write_food(cursor, food)
                     conn.commit()
                     return food_id
                     
         except Exception as e:
             logger.error(f"Error importing food from JSON: {e}")
             raise
+    
+    def import_foods_from_json(self, foods_json: List[Union[Dict, str, FoodData]]) -> List[str]:
+        """
+        Import a batch of foods on one connection in a single transaction.
+        
+        If the batch fails, each food is retried on its own so one bad row
+        doesn't lose the rest.
+        
+        Args:
+            foods_json: Foods as dictionaries, JSON strings, or FoodData objects
+            
+        Returns:
+            Food IDs of the imported foods
+        """
+        foods = []
+        for food_json in foods_json:
+            try:
+                foods.append(self._to_food(food_json))
+            except Exception as e:
+                logger.error(f"Error parsing food for batch import: {e}")
+        if not foods:
+            return []
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    food_ids = [self._write_food(cursor, food) for food in foods]
+                    conn.commit()
+                    return food_ids
+        except Exception as e:
+            logger.warning(f"Batch import of {len(foods)} foods failed, importing one at a time: {e}")
+        
+        food_ids = []
+        for food in foods:
+            try:
+                food_ids.append(self.import_food_from_json(food))
+            except Exception:
+                continue
+        return food_ids
+    
+    def _write_food(self, cursor, food: FoodData) -> str:
+        """Write one food and its child rows on an open cursor, without committing."""
+        cursor.execute(FOOD_UPSERT, (
+            food.food_id, 
+            food.name, 
+            food.description, 
+            food.category,
+            food.processed if hasattr(food, 'processed') else False,
+            food.validated if hasattr(food, 'validated') else False
+        ))
+        
+        food_id = cursor.fetchone()[0]
+        
+        # The child-table writes don't return anything, so render them
+        # client-side and send them to the server in one round trip
+        pending = []
+        
+        if food.standard_nutrients:
+            sn = food.standard_nutrients
+            pending.append(cursor.mogrify(STANDARD_NUTRIENTS_UPSERT, (
+                food_id, 
+                getattr(sn, 'calories', None), 
+                getattr(sn, 'protein_g', None), 
+                getattr(sn, 'carbohydrates_g', None), 
+                getattr(sn, 'fat_g', None), 
+                getattr(sn, 'fiber_g', None),
+                getattr(sn, 'sugars_g', None), 
+                getattr(sn, 'sugars_added_g', None), 
+                getattr(sn, 'calcium_mg', None), 
+                getattr(sn, 'iron_mg', None), 
+                getattr(sn, 'magnesium_mg', None),
+                getattr(sn, 'phosphorus_mg', None), 
+                getattr(sn, 'potassium_mg', None), 
+                getattr(sn, 'sodium_mg', None), 
+                getattr(sn, 'zinc_mg', None), 
+                getattr(sn, 'copper_mg', None),
+                getattr(sn, 'manganese_mg', None), 
+                getattr(sn, 'selenium_mcg', None), 
+                getattr(sn, 'vitamin_c_mg', None), 
+                getattr(sn, 'vitamin_a_iu', None)
+            )))
+        
+        if food.brain_nutrients:
+            bn = food.brain_nutrients
+            pending.append(cursor.mogrify(BRAIN_NUTRIENTS_UPSERT, (
+                food_id, 
+                getattr(bn, 'tryptophan_mg', None), 
+                getattr(bn, 'tyrosine_mg', None), 
+                getattr(bn, 'vitamin_b6_mg', None), 
+                getattr(bn, 'folate_mcg', None),
+                getattr(bn, 'vitamin_b12_mcg', None), 
+                getattr(bn, 'vitamin_d_mcg', None), 
+                getattr(bn, 'magnesium_mg', None), 
+                getattr(bn, 'zinc_mg', None), 
+                getattr(bn, 'iron_mg', None),
+                getattr(bn, 'selenium_mcg', None), 
+                getattr(bn, 'choline_mg', None)
+            )))
+            
+            if hasattr(bn, 'omega3') and bn.omega3:
+                o3 = bn.omega3
+                pending.append(cursor.mogrify(OMEGA3_UPSERT, (
+                    food_id, 
+                    getattr(o3, 'total_g', None), 
+                    getattr(o3, 'epa_mg', None), 
+                    getattr(o3, 'dha_mg', None), 
+                    getattr(o3, 'ala_mg', None),
+                    getattr(o3, 'confidence', None)
+                )))
+        
+        if hasattr(food, 'bioactive_compounds') and food.bioactive_compounds:
+            bc = food.bioactive_compounds
+            pending.append(cursor.mogrify(BIOACTIVE_COMPOUNDS_UPSERT, (
+                food_id, 
+                getattr(bc, 'polyphenols_mg', None), 
+                getattr(bc, 'flavonoids_mg', None), 
+                getattr(bc, 'anthocyanins_mg', None),
+                getattr(bc, 'carotenoids_mg', None), 
+                getattr(bc, 'probiotics_cfu', None), 
+                getattr(bc, 'prebiotic_fiber_g', None)
+            )))
+        
+        if hasattr(food, 'serving_info') and food.serving_info:
+            si = food.serving_info
+            pending.append(cursor.mogrify(SERVING_INFO_UPSERT, (
+                food_id, 
+                getattr(si, 'serving_size', None), 
+                getattr(si, 'serving_unit', None), 
+                getattr(si, 'household_serving', None)
+            )))
+        
+        if hasattr(food, 'data_quality') and food.data_quality:
+            dq = food.data_quality
+            sp = None
+            if hasattr(dq, 'source_priority') and dq.source_priority:
+                # orjson serializes SourcePriority dataclasses and plain dicts alike
+                sp = orjson.dumps(dq.source_priority).decode()
+            
+            pending.append(cursor.mogrify(DATA_QUALITY_UPSERT, (
+                food_id, 
+                getattr(dq, 'completeness', None), 
+                getattr(dq, 'overall_confidence', None),
+                getattr(dq, 'brain_nutrients_source', None), 
+                getattr(dq, 'impacts_source', None), 
+                sp
+            )))
+        
+        if hasattr(food, 'metadata') and food.metadata:
+            md = food.metadata
+            source_urls = orjson.dumps(md.source_urls).decode() if hasattr(md, 'source_urls') and md.source_urls else '[]'
+            source_ids = orjson.dumps(md.source_ids).decode() if hasattr(md, 'source_ids') and md.source_ids else '{}'
+            tags = orjson.dumps(md.tags).decode() if hasattr(md, 'tags') and md.tags else '[]'
+            
+            pending.append(cursor.mogrify(METADATA_UPSERT, (
+                food_id, 
+                getattr(md, 'version', None), 
+                getattr(md, 'created', None), 
+                getattr(md, 'last_updated', None),
+                getattr(md, 'image_url', None), 
+                source_urls, 
+                source_ids, 
+                tags
+            )))
+        
+        if hasattr(food, 'mental_health_impacts') and food.mental_health_impacts:
+            pending.append(cursor.mogrify(MENTAL_HEALTH_IMPACTS_DELETE, (food_id,)))
+        
+        if pending:
+            cursor.execute(b";".join(pending))
+            pending = []
+        
+        if hasattr(food, 'mental_health_impacts') and food.mental_health_impacts:
+            
+            for impact in food.mental_health_impacts:
+                cursor.execute(MENTAL_HEALTH_IMPACT_INSERT, (
+                    food_id, 
+                    getattr(impact, 'impact_type', None), 
+                    getattr(impact, 'direction', None), 
+                    getattr(impact, 'mechanism', None),
+                    getattr(impact, 'strength', None), 
+                    getattr(impact, 'confidence', None), 
+                    getattr(impact, 'time_to_effect', None), 
+                    getattr(impact, 'research_context', None), 
+                    getattr(impact, 'notes', None)
+                ))
+                
+                impact_id = cursor.fetchone()[0]
+                
+                if hasattr(impact, 'research_support') and impact.research_support:
+                    for support in impact.research_support:
+                        pending.append(cursor.mogrify(RESEARCH_SUPPORT_INSERT, (
+                            impact_id, 
+                            getattr(support, 'citation', None), 
+                            getattr(support, 'doi', None), 
+                            getattr(support, 'url', None),
+                            getattr(support, 'study_type', None), 
+                            getattr(support, 'year', None)
+                        )))
+            
+            if pending:
+                cursor.execute(b";".join(pending))
+        
+        return food_id
 
     def get_foods_by_name(self, food_name: str) -> List[FoodData]:
         try:
@@ -571,23 +675,88 @@ class PostgresClient:
             raise
     
     def get_all_foods_without_mental_health_impacts(self, limit: Optional[int] = None) -> List[FoodData]:
+        return list(self.iter_foods_without_mental_health_impacts(limit))
+    
+    def iter_foods_without_mental_health_impacts(self, limit: Optional[int] = None) -> Iterator[FoodData]:
+        """
+        Lazily load foods that have no mental health impacts yet.
+        
+        Each food is only loaded when the caller asks for it, so processing of
+        the first foods can start while later ones are still being read.
+        
+        Args:
+            limit: Maximum number of foods (defaults to 100)
+            
+        Yields:
+            FoodData objects
+        """
         limit_val = limit if limit is not None else 100  # Default limit
         
         try:
             results = self.execute_query(FOOD_GET_WITHOUT_IMPACTS, (limit_val,))
+        except Exception as e:
+            logger.error(f"Error getting foods without mental health impacts: {e}")
+            return
+        
+        for result in results:
+            try:
+                food = self.get_food_by_id_or_name(result["food_id"])
+            except Exception as e:
+                logger.error(f"Error loading food {result['food_id']}: {e}")
+                continue
+            if food:
+                yield food
+    
+    def migrate_pipeline_schema(self) -> None:
+        """
+        Apply the pipeline's schema additions that are not in place yet.
+        
+        Each migration is checked against the catalog first, so an up-to-date
+        database takes no DDL locks. Runs once per client; later calls are no-ops.
+        """
+        if self._schema_migrated:
+            return
+        
+        for name, check_query, check_params, ddl in PIPELINE_MIGRATIONS:
+            if self.execute_query(check_query, check_params)[0]["applied"]:
+                continue
+            logger.info(f"Applying schema migration: {name}")
+            self.execute_query(ddl, fetch=False)
+        
+        self._schema_migrated = True
+    
+    def get_existing_food_ids(self, food_ids: List[str]) -> Set[str]:
+        """Return the subset of food_ids that are already stored, in one query."""
+        if not food_ids:
+            return set()
+        return {row["food_id"] for row in self.execute_query(FOOD_GET_EXISTING_IDS, (list(food_ids),))}
+    
+    def get_collected_queries(self, source: str, query_hashes: List[str]) -> Dict[str, List[str]]:
+        """
+        Look up queries a collector has already imported.
+        
+        Args:
+            source: Collector name
+            query_hashes: Hashes of the search queries
             
-            foods = []
-            for result in results:
-                food_id = result["food_id"]
-                food = self.get_food_by_id_or_name(food_id)
-                if food:
-                    foods.append(food)
-            
-            return foods
+        Returns:
+            Dictionary mapping each collected query hash to its stored result IDs
+        """
+        results = self.execute_query(COLLECTED_QUERIES_GET, (source, list(query_hashes)))
+        return {row["query_hash"]: row["result_ids"] for row in results}
+    
+    def save_collected_query(self, source: str, query_hash: str, result_ids: List[str]) -> bool:
+        try:
+            self.execute_query(
+                COLLECTED_QUERY_UPSERT,
+                (source, query_hash, orjson.dumps(result_ids).decode()),
+                fetch=False
+            )
+            return True
             
         except Exception as e:
-            logger.error(f"Error getting foods without mental health impacts: {e}")
-            return []
+            logger.error(f"Error recording collected query for {source}: {e}")
+            return False
     
     def save_evaluation(self, food_id: str, test_run_id: str, evaluation_type: str, evaluation_data: Dict) -> bool:
         try:
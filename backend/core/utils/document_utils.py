@@ -4,12 +4,12 @@ Document extraction utilities for processing PDFs and web pages.
 """
 
 import re
-import requests
 from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 import pdfplumber
 from datetime import datetime
 
+from utils.api_utils import get_session
 from utils.logging_utils import setup_logging
 
 # Initialize logger
@@ -69,7 +69,6 @@ class PDFExtractor:
         Returns:
             Tuple of (extracted_text, metadata)
         """
-        text = ""
         metadata = None
         
         try:
@@ -82,8 +81,7 @@ class PDFExtractor:
                 metadata = self._extract_metadata(first_page_text, pdf.metadata)
                 
                 # Extract text from all pages
-                for page in pdf.pages:
-                    text += page.extract_text() + "\n"
+                text = "".join((page.extract_text() or "") + "\n" for page in pdf.pages)
             
             return text, metadata
             
@@ -145,6 +143,15 @@ class PDFExtractor:
         return None
 
 
+def extract_pdf_text(pdf_path: str) -> Tuple[str, Optional[StudyMetadata]]:
+    """
+    Extract text and metadata from a PDF file.
+    
+    Module-level so it can be pickled and run in a worker process.
+    """
+    return PDFExtractor().extract_text(pdf_path)
+
+
 class WebPageExtractor:
     """Extracts text from web pages."""
     
@@ -163,7 +170,7 @@ class WebPageExtractor:
                 "User-Agent": "NutritionalPsychiatryDatabase/1.0",
                 "Accept": "text/html,application/xhtml+xml,application/xml"
             }
-            response = requests.get(url, headers=headers, timeout=30)
+            response = get_session().get(url, headers=headers, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -7,6 +7,8 @@ import json
 import re
 from typing import Dict, Any, Optional
 
+import orjson
+
 from utils.logging_utils import setup_logging
 
 logger = setup_logging(__name__)
@@ -28,19 +30,37 @@ class JSONParser:
     
     @staticmethod
     def parse_json(text: str, default: Any = None) -> Dict:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         try:
-            return json.loads(text)
+            return orjson.loads(text)
         except json.JSONDecodeError:
             json_str = JSONParser.extract_json(text)
             if json_str:
                 try:
-                    return json.loads(json_str)
+                    return orjson.loads(json_str)
                 except json.JSONDecodeError:
                     logger.warning(f"Could not parse JSON even after extraction: {json_str[:100]}...")
             
             logger.error(f"Failed to parse JSON: {text[:100]}...")
             return default if default is not None else {}
     
+    @staticmethod
+    def load_file(path: str) -> Any:
+        """
+        Load a JSON document from disk.
+        
+        Reads raw bytes and parses them with orjson, skipping the text decode
+        and the per-element work of the stdlib parser.
+        
+        Args:
+            path: Path to the JSON file
+            
+        Returns:
+            Parsed JSON value
+        """
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
     @staticmethod
     def validate_json_schema(data: Dict, required_fields: list) -> bool:
         return all(field in data for field in required_fields)
\ No newline at end of file
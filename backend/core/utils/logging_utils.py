@@ -1,10 +1,134 @@
+import atexit
+import contextvars
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 import json
+import threading
 import time
-from typing import Optional, Dict, Any, List
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Callable, Optional, Dict, Any, List
 from functools import wraps
 
+# Per-step log files are rotated at this size
+STEP_LOG_MAX_BYTES = 10 * 1024 * 1024
+STEP_LOG_BACKUPS = 3
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_log_queue = queue.SimpleQueue()
+_listener = None
+_listener_pid = None
+_listener_lock = threading.Lock()
+
+# Direct stdout handler for forked children, with the PID it was built in
+_child_handler = None
+_child_handler_pid = None
+
+# Pipeline step the current thread or task is running, if any
+_current_step: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_step", default=None)
+
+class _StepFilter(logging.Filter):
+    """Tag records with the running pipeline step before they are queued."""
+    
+    def filter(self, record):
+        record.step = _current_step.get()
+        return True
+
+class _StepFileHandler(logging.Handler):
+    """Append records tagged with a step to a rotating <log_dir>/<step>.log."""
+    
+    def __init__(self, log_dir: str):
+        super().__init__()
+        self.log_dir = log_dir
+        self.step_handlers: Dict[str, logging.Handler] = {}
+    
+    def emit(self, record):
+        step = getattr(record, "step", None)
+        if step is None:
+            return
+        
+        handler = self.step_handlers.get(step)
+        if handler is None:
+            os.makedirs(self.log_dir, exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                os.path.join(self.log_dir, f"{step}.log"),
+                maxBytes=STEP_LOG_MAX_BYTES,
+                backupCount=STEP_LOG_BACKUPS,
+                delay=True
+            )
+            handler.setFormatter(self.formatter)
+            self.step_handlers[step] = handler
+        handler.emit(record)
+    
+    def close(self):
+        for handler in self.step_handlers.values():
+            handler.close()
+        super().close()
+
+class _ProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue records for the listener thread of the process that started it.
+    
+    A worker forked after the listener started inherits the queue but not the
+    thread draining it, so there records are written straight to stdout instead
+    of being queued where nothing would ever read them.
+    """
+    
+    def emit(self, record):
+        if os.getpid() == _listener_pid:
+            super().emit(record)
+        else:
+            _get_child_handler().handle(record)
+
+def _get_child_handler() -> logging.Handler:
+    global _child_handler, _child_handler_pid
+    pid = os.getpid()
+    if _child_handler_pid != pid:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        _child_handler, _child_handler_pid = handler, pid
+    return _child_handler
+
+@contextmanager
+def log_to_step(step_name: str):
+    """Copy records logged while running a pipeline step into that step's log file."""
+    token = _current_step.set(step_name)
+    try:
+        yield
+    finally:
+        _current_step.reset(token)
+
+def submit_in_context(executor: Executor, fn: Callable, *args, **kwargs) -> Future:
+    """
+    Submit work to a thread pool in a copy of the caller's context.
+    
+    Pool threads don't inherit context variables, so without this the records
+    they log lose the pipeline step and miss the step's log file.
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+def _ensure_listener():
+    # One background thread owns stdout and the step log files; callers only
+    # enqueue records
+    global _listener, _listener_pid
+    with _listener_lock:
+        if _listener is None:
+            formatter = logging.Formatter(LOG_FORMAT)
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(formatter)
+            step_handler = _StepFileHandler(os.environ.get("LOG_DIR", "logs"))
+            step_handler.setFormatter(formatter)
+            _listener = logging.handlers.QueueListener(_log_queue, handler, step_handler, respect_handler_level=True)
+            _listener.start()
+            _listener_pid = os.getpid()
+            # atexit runs in reverse, so the queue drains before files close
+            atexit.register(step_handler.close)
+            atexit.register(_listener.stop)
+
 def setup_logging(name=None, level=logging.INFO):
     logger = logging.getLogger(name or __name__)
     logger.setLevel(level)
@@ -12,9 +136,9 @@ def setup_logging(name=None, level=logging.INFO):
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
-    handler = logging.StreamHandler(sys.stdout)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    handler.setFormatter(formatter)
+    _ensure_listener()
+    handler = _ProcessQueueHandler(_log_queue)
+    handler.addFilter(_StepFilter())
     logger.addHandler(handler)
     
     return logger
@@ -29,23 +153,24 @@ def log_execution_time(logger: Optional[logging.Logger] = None):
             start_time = time.time()
             result = func(*args, **kwargs)
             execution_time = time.time() - start_time
-            logger.debug(f"{func.__name__} executed in {execution_time:.4f} seconds")
+            logger.debug("%s executed in %.4f seconds", func.__name__, execution_time)
             return result
         return wrapper
     
     return decorator
 
 def log_api_request(logger, api: str, task_type: str, model: str, messages: List[Dict], params: Dict):
-    logger.debug(
-        f"API Request: {api}, Task: {task_type}, Model: {model}, "
-        f"Params: {json.dumps(params)}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "API Request: %s, Task: %s, Model: %s, Params: %s",
+            api, task_type, model, json.dumps(params)
+        )
 
 def log_api_response(logger, api: str, task_type: str, response: Any):
-    logger.debug(f"API Response: {api}, Task: {task_type}, Success: True")
+    logger.debug("API Response: %s, Task: %s, Success: True", api, task_type)
 
 def log_api_error(logger, api: str, task_type: str, error: Exception, context: Dict):
     logger.error(
-        f"API Error: {api}, Task: {task_type}, Error: {type(error).__name__}, "
-        f"Message: {str(error)}, Context: {json.dumps(context)}"
+        "API Error: %s, Task: %s, Error: %s, Message: %s, Context: %s",
+        api, task_type, type(error).__name__, error, json.dumps(context)
     )
\ No newline at end of file
@@ -1,4 +1,3 @@
-import json
 import os
 from typing import Dict, List, Any, Optional
 from schema.food_data import BrainNutrients, StandardNutrients
@@ -215,8 +214,7 @@ class NutrientNameNormalizer:
         # Load additional mappings if provided
         if mapping_file and os.path.exists(mapping_file):
             try:
-                with open(mapping_file, 'r') as f:
-                    additional_mappings = json.load(f)
+                additional_mappings = JSONParser.load_file(mapping_file)
                 self.mapping.update(additional_mappings)
                 logger.info(f"Loaded {len(additional_mappings)} additional nutrient mappings")
             except Exception as e:
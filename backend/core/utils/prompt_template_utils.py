@@ -3,12 +3,26 @@ import re
 import os
 import json
 import glob
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
+from utils.json_utils import JSONParser
 from utils.logging_utils import setup_logging
 
 logger = setup_logging(__name__)
 
+@lru_cache(maxsize=None)
+def _load_templates(template_dir: str) -> Dict[str, Dict]:
+    """Parse every template in a directory once, keyed by template_id."""
+    templates = {}
+    for file_path in glob.glob(os.path.join(template_dir, "*.json")):
+        try:
+            template_data = JSONParser.load_file(file_path)
+            templates.setdefault(template_data.get("template_id"), template_data)
+        except Exception as e:
+            logger.error(f"Error loading template from {file_path}: {e}")
+    return templates
+
 class TemplateManager:
     """Manages loading and processing of templates."""
     
@@ -17,20 +31,12 @@ class TemplateManager:
         if not template_dir:
             from constants.ai_constants import TEMPLATE_DIR
             template_dir = TEMPLATE_DIR
-            
-        template_pattern = os.path.join(template_dir, "*.json")
-        template_files = glob.glob(template_pattern)
-        
-        for file_path in template_files:
-            try:
-                with open(file_path, 'r') as f:
-                    template_data = json.load(f)
-                    if template_data.get("template_id") == template_id:
-                        return template_data
-            except Exception as e:
-                logger.error(f"Error loading template from {file_path}: {e}")
         
-        raise ValueError(f"Template with ID '{template_id}' not found")
+        # Templates are shared across calls, so callers must not modify them
+        template_data = _load_templates(template_dir).get(template_id)
+        if template_data is None:
+            raise ValueError(f"Template with ID '{template_id}' not found")
+        return template_data
 
     @staticmethod
     def sanitize_variables(variables: Dict[str, Any]) -> Dict[str, Any]: